@@ -5,30 +5,35 @@ Batch Fix EN Blog Files - Sorokid
 Tự động thêm các fields thiếu cho EN blog posts
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 
-def get_vi_slug_from_en(en_data, en_file_path):
+from blog_corpus import CorpusIndex, changed_since_closure
+from blog_io import load_post, read_files, write_post
+from blog_profile import run_profiled, stage
+from blog_reading_time import estimate_reading_time
+
+# Key order used when writing fixed files
+EN_KEY_ORDER = [
+    'slug', 'title', 'description', 'category', 'keywords',
+    'status', 'publishedAt', 'createdAt', 'image', 'imageAlt',
+    'readingTime', 'categoryOrder', 'order', 'author', 'translations',
+    'content', 'faq', 'cta', 'seo', 'schema', 'postId'
+]
+
+
+def get_vi_slug_from_en(en_data, en_file_stem, index=None):
     """Tìm VI slug tương ứng từ EN file"""
     # Nếu có postId, đó chính là VI slug
     if 'postId' in en_data:
         return en_data['postId']
     
     # Tìm trong VI posts xem file nào link đến EN này
-    VI_POSTS = en_file_path.parent.parent
-    en_slug = en_data.get('slug', en_file_path.stem)
+    en_slug = en_data.get('slug', en_file_stem)
     
-    for vi_file in VI_POSTS.glob('*.json'):
-        if vi_file.stem in ['categories', 'categories.en']:
-            continue
-        try:
-            with open(vi_file, 'r', encoding='utf-8') as f:
-                vi_data = json.load(f)
-            if vi_data.get('translations', {}).get('en') == en_slug:
-                return vi_file.stem
-        except:
-            pass
+    vi_slug = index.find_vi_for_en(en_slug) if index else None
+    if vi_slug:
+        return vi_slug
     
     return en_slug  # Fallback to EN slug
 
@@ -99,28 +104,40 @@ def generate_default_schema(en_data):
     }
 
 
-def fix_en_file(file_path, dry_run=False):
-    """Fix một EN file - thêm các fields thiếu"""
-    changes = []
+def reorder_en_keys(data):
+    """Reorder keys for consistency (EN_KEY_ORDER first, then the rest)"""
+    ordered_data = {}
+    for key in EN_KEY_ORDER:
+        if key in data:
+            ordered_data[key] = data[key]
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        return False, [f"Error reading file: {e}"]
+    # Add any remaining keys
+    for key in data:
+        if key not in ordered_data:
+            ordered_data[key] = data[key]
     
+    return ordered_data
+
+
+def fix_en_data(data, slug, index=None):
+    """Thêm các fields thiếu vào EN post đã parse (sửa trực tiếp data)
+
+    slug: tên file EN; index: CorpusIndex để tìm bản VI
+    Trả về (modified, changes)
+    """
+    changes = []
     modified = False
     
     # 1. Add translations if missing
     if 'translations' not in data:
-        vi_slug = get_vi_slug_from_en(data, file_path)
+        vi_slug = get_vi_slug_from_en(data, slug, index=index)
         data['translations'] = {"vi": vi_slug}
         changes.append(f"Added translations.vi = {vi_slug}")
         modified = True
     
     # 2. Add postId if missing
     if 'postId' not in data:
-        vi_slug = data.get('translations', {}).get('vi', file_path.stem)
+        vi_slug = data.get('translations', {}).get('vi', slug)
         data['postId'] = vi_slug
         changes.append(f"Added postId = {vi_slug}")
         modified = True
@@ -166,10 +183,7 @@ def fix_en_file(file_path, dry_run=False):
         modified = True
     
     if 'readingTime' not in data:
-        # Estimate from content
-        content = data.get('content', {})
-        word_count = len(str(content).split())
-        data['readingTime'] = max(5, min(20, word_count // 200))
+        data['readingTime'] = estimate_reading_time(data.get('content', {}), 'en')
         changes.append(f"Added readingTime = {data['readingTime']}")
         modified = True
     
@@ -181,36 +195,43 @@ def fix_en_file(file_path, dry_run=False):
             changes.append("Converted keywords to array")
             modified = True
     
-    # Save if modified
+    return modified, changes
+
+
+def fix_en_file(file_path, dry_run=False, index=None, raw=None):
+    """Fix một EN file - thêm các fields thiếu
+
+    index: CorpusIndex dùng chung cho cả batch (tự dựng nếu không truyền vào)
+    raw: nội dung file nếu đã đọc trước (read_files)
+    """
+    try:
+        data = load_post(file_path, raw)
+    except Exception as e:
+        return False, [f"Error reading file: {e}"]
+    
+    if index is None and 'translations' not in data and 'postId' not in data:
+        index = CorpusIndex.build(file_path.parent.parent, file_path.parent)
+    
+    with stage('fix'):
+        modified, changes = fix_en_data(data, file_path.stem, index=index)
+    
+    # Save if modified (skips the write when bytes on disk are identical)
     if modified and not dry_run:
-        # Reorder keys for consistency
-        ordered_keys = [
-            'slug', 'title', 'description', 'category', 'keywords',
-            'status', 'publishedAt', 'createdAt', 'image', 'imageAlt',
-            'readingTime', 'categoryOrder', 'order', 'author', 'translations',
-            'content', 'faq', 'cta', 'seo', 'schema', 'postId'
-        ]
-        
-        ordered_data = {}
-        for key in ordered_keys:
-            if key in data:
-                ordered_data[key] = data[key]
-        
-        # Add any remaining keys
-        for key in data:
-            if key not in ordered_data:
-                ordered_data[key] = data[key]
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(ordered_data, f, ensure_ascii=False, indent=2)
+        write_post(file_path, reorder_en_keys(data))
     
     return modified, changes
 
 
-def batch_fix_en_files(dry_run=False):
-    """Fix tất cả EN files"""
+def batch_fix_en_files(dry_run=False, changed_since=None, posts_dir=None):
+    """Fix tất cả EN files
+
+    changed_since: git revision - chỉ fix các bài thay đổi từ revision đó
+    (kèm bản dịch liên kết)
+    posts_dir: thư mục posts VI, EN nằm trong posts_dir/en
+    """
     BASE = Path(__file__).parent.parent
-    EN_POSTS = BASE / 'content' / 'blog' / 'posts' / 'en'
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
+    EN_POSTS = VI_POSTS / 'en'
     
     print("🔧 BATCH FIX EN BLOG FILES")
     print("=" * 60)
@@ -225,10 +246,19 @@ def batch_fix_en_files(dry_run=False):
         'errors': 0
     }
     
-    for file_path in sorted(EN_POSTS.glob('*.json')):
+    # Load every post once for translation lookups
+    index = CorpusIndex.build(VI_POSTS, EN_POSTS)
+    
+    if changed_since:
+        _, files = changed_since_closure(changed_since, VI_POSTS, index=index)
+        print(f"📝 Changed since {changed_since}: {len(files)} EN files\n")
+    else:
+        files = sorted(EN_POSTS.glob('*.json'))
+    
+    for file_path, raw in read_files(files):
         stats['total'] += 1
         
-        modified, changes = fix_en_file(file_path, dry_run)
+        modified, changes = fix_en_file(file_path, dry_run, index=index, raw=raw)
         
         if changes and changes[0].startswith('Error'):
             stats['errors'] += 1
@@ -260,5 +290,16 @@ def batch_fix_en_files(dry_run=False):
 if __name__ == '__main__':
     import sys
     
-    dry_run = '--dry-run' in sys.argv
-    batch_fix_en_files(dry_run=dry_run)
+    def main():
+        dry_run = '--dry-run' in sys.argv
+        changed_since = None
+        if '--changed-since' in sys.argv:
+            changed_since = sys.argv[sys.argv.index('--changed-since') + 1]
+        
+        try:
+            batch_fix_en_files(dry_run=dry_run, changed_since=changed_since)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+    
+    run_profiled(main)
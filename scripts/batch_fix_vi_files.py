@@ -5,10 +5,23 @@ Batch Fix VI Blog Files - Sorokid
 Tự động thêm các fields thiếu cho VI blog posts
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 
+from blog_corpus import CorpusIndex, changed_since_closure, iter_post_files
+from blog_io import load_post, read_files, write_post
+from blog_profile import run_profiled, stage
+from blog_reading_time import estimate_reading_time
+
+# Key order used when writing fixed files
+VI_KEY_ORDER = [
+    'slug', 'title', 'description', 'category', 'keywords',
+    'status', 'publishedAt', 'createdAt', 'image', 'imageAlt',
+    'readingTime', 'categoryOrder', 'order', 'author', 'translations',
+    'content', 'faq', 'cta', 'seo', 'schema'
+]
+
+
 def generate_default_faq_vi(vi_data):
     """Tạo FAQ mặc định tiếng Việt dựa trên nội dung"""
     title = vi_data.get('title', 'chủ đề này')
@@ -75,16 +88,28 @@ def generate_default_schema_vi(vi_data):
     }
 
 
-def fix_vi_file(file_path, dry_run=False):
-    """Fix một VI file - thêm các fields thiếu"""
-    changes = []
+def reorder_vi_keys(data):
+    """Reorder keys for consistency (VI_KEY_ORDER first, then the rest)"""
+    ordered_data = {}
+    for key in VI_KEY_ORDER:
+        if key in data:
+            ordered_data[key] = data[key]
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        return False, [f"Error reading file: {e}"]
+    # Add any remaining keys
+    for key in data:
+        if key not in ordered_data:
+            ordered_data[key] = data[key]
     
+    return ordered_data
+
+
+def fix_vi_data(data, slug, index=None):
+    """Thêm các fields thiếu vào VI post đã parse (sửa trực tiếp data)
+
+    slug: tên file VI; index: CorpusIndex để tìm bản EN
+    Trả về (modified, changes)
+    """
+    changes = []
     modified = False
     
     # 1. Add faq if missing (at root level)
@@ -133,10 +158,7 @@ def fix_vi_file(file_path, dry_run=False):
         modified = True
     
     if 'readingTime' not in data:
-        # Estimate from content
-        content = data.get('content', {})
-        word_count = len(str(content).split())
-        data['readingTime'] = max(5, min(20, word_count // 150))
+        data['readingTime'] = estimate_reading_time(data.get('content', {}), 'vi')
         changes.append(f"Added readingTime = {data['readingTime']}")
         modified = True
     
@@ -150,53 +172,49 @@ def fix_vi_file(file_path, dry_run=False):
     
     # 7. Add translations if has EN version
     if 'translations' not in data:
-        # Check if EN version exists
-        EN_POSTS = file_path.parent / 'en'
-        vi_slug = file_path.stem
-        
-        # Look for EN file that references this VI
-        for en_file in EN_POSTS.glob('*.json'):
-            try:
-                with open(en_file, 'r', encoding='utf-8') as f:
-                    en_data = json.load(f)
-                if en_data.get('postId') == vi_slug or en_data.get('translations', {}).get('vi') == vi_slug:
-                    data['translations'] = {"en": en_file.stem}
-                    changes.append(f"Added translations.en = {en_file.stem}")
-                    modified = True
-                    break
-            except:
-                pass
-    
-    # Save if modified
+        # Look up EN file that references this VI (postId / translations.vi)
+        en_slug = index.find_en_for_vi(slug) if index else None
+        if en_slug:
+            data['translations'] = {"en": en_slug}
+            changes.append(f"Added translations.en = {en_slug}")
+            modified = True
+    
+    return modified, changes
+
+
+def fix_vi_file(file_path, dry_run=False, index=None, raw=None):
+    """Fix một VI file - thêm các fields thiếu
+
+    index: CorpusIndex dùng chung cho cả batch (tự dựng nếu không truyền vào)
+    raw: nội dung file nếu đã đọc trước (read_files)
+    """
+    try:
+        data = load_post(file_path, raw)
+    except Exception as e:
+        return False, [f"Error reading file: {e}"]
+    
+    if index is None and 'translations' not in data:
+        index = CorpusIndex.build(file_path.parent)
+    
+    with stage('fix'):
+        modified, changes = fix_vi_data(data, file_path.stem, index=index)
+    
+    # Save if modified (skips the write when bytes on disk are identical)
     if modified and not dry_run:
-        # Reorder keys for consistency
-        ordered_keys = [
-            'slug', 'title', 'description', 'category', 'keywords',
-            'status', 'publishedAt', 'createdAt', 'image', 'imageAlt',
-            'readingTime', 'categoryOrder', 'order', 'author', 'translations',
-            'content', 'faq', 'cta', 'seo', 'schema'
-        ]
-        
-        ordered_data = {}
-        for key in ordered_keys:
-            if key in data:
-                ordered_data[key] = data[key]
-        
-        # Add any remaining keys
-        for key in data:
-            if key not in ordered_data:
-                ordered_data[key] = data[key]
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(ordered_data, f, ensure_ascii=False, indent=2)
+        write_post(file_path, reorder_vi_keys(data))
     
     return modified, changes
 
 
-def batch_fix_vi_files(dry_run=False):
-    """Fix tất cả VI files"""
+def batch_fix_vi_files(dry_run=False, changed_since=None, posts_dir=None):
+    """Fix tất cả VI files
+
+    changed_since: git revision - chỉ fix các bài thay đổi từ revision đó
+    (kèm bản dịch liên kết)
+    posts_dir: thư mục posts VI (mặc định content/blog/posts)
+    """
     BASE = Path(__file__).parent.parent
-    VI_POSTS = BASE / 'content' / 'blog' / 'posts'
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
     
     print("BATCH FIX VI BLOG FILES")
     print("=" * 60)
@@ -211,13 +229,19 @@ def batch_fix_vi_files(dry_run=False):
         'errors': 0
     }
     
-    for file_path in sorted(VI_POSTS.glob('*.json')):
-        if file_path.stem in ['categories', 'categories.en']:
-            continue
-        
+    # Load every post once for translation lookups
+    index = CorpusIndex.build(VI_POSTS)
+    
+    if changed_since:
+        files, _ = changed_since_closure(changed_since, VI_POSTS, index=index)
+        print(f"Changed since {changed_since}: {len(files)} VI files\n")
+    else:
+        files = iter_post_files(VI_POSTS)
+    
+    for file_path, raw in read_files(files):
         stats['total'] += 1
         
-        modified, changes = fix_vi_file(file_path, dry_run)
+        modified, changes = fix_vi_file(file_path, dry_run, index=index, raw=raw)
         
         if changes and changes[0].startswith('Error'):
             stats['errors'] += 1
@@ -249,5 +273,16 @@ def batch_fix_vi_files(dry_run=False):
 if __name__ == '__main__':
     import sys
     
-    dry_run = '--dry-run' in sys.argv
-    batch_fix_vi_files(dry_run=dry_run)
+    def main():
+        dry_run = '--dry-run' in sys.argv
+        changed_since = None
+        if '--changed-since' in sys.argv:
+            changed_since = sys.argv[sys.argv.index('--changed-since') + 1]
+        
+        try:
+            batch_fix_vi_files(dry_run=dry_run, changed_since=changed_since)
+        except RuntimeError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(2)
+    
+    run_profiled(main)
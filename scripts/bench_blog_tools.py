@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Blog Tools - Sorokid
+Sinh corpus VI/EN giả lập trong thư mục tạm và đo thời gian, throughput,
+bộ nhớ đỉnh của từng script blog
+
+Usage:
+    python scripts/bench_blog_tools.py                          # 1k VI posts
+    python scripts/bench_blog_tools.py --sizes 1000,10000,50000
+    python scripts/bench_blog_tools.py --targets validate_blog_json,blog_pipeline
+    python scripts/bench_blog_tools.py --save-baseline bench_baseline.json
+    python scripts/bench_blog_tools.py --baseline bench_baseline.json
+
+Every run starts cold: targets get SOROKID_MANIFEST=off, so nothing is read
+from or written to scripts/.blog_manifest.json. --warm-manifest gives each
+target its own manifest file, primed by one unmeasured run.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from blog_io import JSON_BACKEND, dump_post_bytes
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CATEGORIES = ['soroban', 'hoc-toan-tai-nha', 'phuong-phap-hoc', 'giao-vien', 'toolbox']
+
+WORDS = {
+    'vi': ['con', 'học', 'toán', 'bàn', 'tính', 'phụ', 'huynh', 'bé', 'luyện', 'tập',
+           'mỗi', 'ngày', 'tư', 'duy', 'nhẩm', 'nhanh', 'giáo', 'viên', 'lớp', 'bài'],
+    'en': ['child', 'math', 'abacus', 'parents', 'practice', 'daily', 'mental', 'skills',
+           'learning', 'teacher', 'class', 'minutes', 'focus', 'numbers', 'game', 'kids'],
+}
+
+
+def _text(rng, lang, lo, hi):
+    return ' '.join(rng.choice(WORDS[lang]) for _ in range(rng.randint(lo, hi)))
+
+
+def _section(rng, lang):
+    kind = rng.choices(['paragraph', 'heading', 'list', 'callout', 'table'],
+                       weights=[47, 32, 14, 6, 1])[0]
+    if kind == 'heading':
+        return {'type': 'heading', 'level': rng.choice([2, 3]), 'text': _text(rng, lang, 3, 8)}
+    if kind == 'list':
+        return {'type': 'list', 'items': [_text(rng, lang, 4, 14) for _ in range(rng.randint(3, 7))]}
+    if kind == 'callout':
+        return {'type': 'callout', 'style': rng.choice(['tip', 'warning', 'info']),
+                'text': _text(rng, lang, 10, 30)}
+    if kind == 'table':
+        cols = rng.randint(2, 4)
+        return {'type': 'table',
+                'headers': [_text(rng, lang, 1, 3) for _ in range(cols)],
+                'rows': [[_text(rng, lang, 1, 5) for _ in range(cols)]
+                         for _ in range(rng.randint(3, 6))]}
+    return {'type': 'paragraph', 'text': _text(rng, lang, 15, 60)}
+
+
+def _post(rng, lang, slug, sections, missing_rate):
+    title = _text(rng, lang, 5, 12)
+    keywords = [_text(rng, lang, 2, 4) for _ in range(rng.randint(3, 12))]
+    published = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T08:00:00.000Z"
+    post = {
+        'slug': slug,
+        'title': title,
+        'description': _text(rng, lang, 15, 30),
+        'category': rng.choice(CATEGORIES),
+        'keywords': keywords,
+        'status': rng.choice(['published', 'published', 'published', 'draft']),
+        'publishedAt': published,
+        'createdAt': published.split('T')[0],
+        'image': f'/blog/{slug}.jpg',
+        'imageAlt': title,
+        'readingTime': rng.randint(5, 20),
+        'author': {'name': 'Minh Anh', 'role': 'Bench'},
+        'content': {
+            'intro': _text(rng, lang, 20, 50),
+            'sections': [_section(rng, lang) for _ in range(sections)],
+        },
+        'faq': [{'question': _text(rng, lang, 5, 10), 'answer': _text(rng, lang, 15, 40)}
+                for _ in range(rng.randint(3, 10))],
+        'cta': {'text': _text(rng, lang, 10, 25), 'buttonText': _text(rng, lang, 2, 4),
+                'buttonLink': '/register'},
+        'seo': {'title': title, 'description': _text(rng, lang, 15, 30),
+                'keywords': ', '.join(keywords)},
+        'schema': {'type': 'Article', 'datePublished': published.split('T')[0],
+                   'author': 'Minh Anh'},
+    }
+    # Leave some fields out so the fixers and validator have work to do
+    for field in ('faq', 'cta', 'seo', 'schema', 'createdAt', 'readingTime'):
+        if rng.random() < missing_rate:
+            del post[field]
+    return post
+
+
+def generate_corpus(root, size, seed=0, link_density=0.9,
+                    min_sections=10, max_sections=80, missing_rate=0.05):
+    """Write `size` VI posts (+ linked EN posts) under root/posts
+
+    link_density: share of VI posts that get an EN translation
+    Returns {'vi': n, 'en': n, 'bytes': total}
+    """
+    rng = random.Random(seed)
+    vi_dir = Path(root) / 'posts'
+    en_dir = vi_dir / 'en'
+    en_dir.mkdir(parents=True, exist_ok=True)
+
+    stats = {'vi': 0, 'en': 0, 'bytes': 0}
+    for i in range(size):
+        vi_slug = f'bai-viet-{i:06d}'
+        vi = _post(rng, 'vi', vi_slug, rng.randint(min_sections, max_sections), missing_rate)
+        outputs = [(vi_dir / f'{vi_slug}.json', vi, 'vi')]
+
+        if rng.random() < link_density:
+            en_slug = f'post-{i:06d}'
+            en = _post(rng, 'en', en_slug, rng.randint(min_sections, max_sections), missing_rate)
+            vi['translations'] = {'en': en_slug}
+            en['translations'] = {'vi': vi_slug}
+            if rng.random() >= missing_rate:
+                en['postId'] = vi_slug
+            outputs.append((en_dir / f'{en_slug}.json', en, 'en'))
+
+        for path, data, lang in outputs:
+            payload = dump_post_bytes(data)
+            path.write_bytes(payload)
+            stats[lang] += 1
+            stats['bytes'] += len(payload)
+
+    return stats
+
+
+# Each target runs one script's main function against a posts directory.
+# Everything that would write posts runs in dry-run mode so the corpus
+# stays identical between targets and repeats.
+def _target_scan(posts_dir, work_dir):
+    from scan_blog_status import scan_blog_status
+    scan_blog_status(posts_dir=posts_dir, report_path=work_dir / 'blog_status_report.json')
+
+
+def _target_validate(posts_dir, work_dir):
+    from validate_blog_json import validate_all_blogs
+    validate_all_blogs(use_cache=False, posts_dir=posts_dir)
+
+
+def _target_validate_jobs(posts_dir, work_dir):
+    from validate_blog_json import validate_all_blogs
+    validate_all_blogs(jobs=os.cpu_count() or 1, use_cache=False, posts_dir=posts_dir)
+
+
+def _target_fix_vi(posts_dir, work_dir):
+    from batch_fix_vi_files import batch_fix_vi_files
+    batch_fix_vi_files(dry_run=True, posts_dir=posts_dir)
+
+
+def _target_fix_en(posts_dir, work_dir):
+    from batch_fix_en_files import batch_fix_en_files
+    batch_fix_en_files(dry_run=True, posts_dir=posts_dir)
+
+
+def _target_author(posts_dir, work_dir):
+    # Synthetic posts always have an author, so this never writes
+    from final_fix_author_image import main
+    main(posts_dir=posts_dir)
+
+
+def _target_orphans(posts_dir, work_dir):
+    from cleanup_orphan_en_files import main
+    main(dry_run=True, posts_dir=posts_dir)
+
+
+def _target_pipeline(posts_dir, work_dir):
+    from blog_pipeline import run_pipeline
+    run_pipeline(dry_run=True, posts_dir=posts_dir,
+                 report_path=work_dir / 'pipeline_status_report.json')
+
+
+def _target_duplicates(posts_dir, work_dir):
+    from blog_duplicates import scan_duplicates
+    scan_duplicates(posts_dir=posts_dir)
+
+
+TARGETS = {
+    'scan_blog_status': _target_scan,
+    'validate_blog_json': _target_validate,
+    'validate_blog_json_jobs': _target_validate_jobs,
+    'batch_fix_vi_files': _target_fix_vi,
+    'batch_fix_en_files': _target_fix_en,
+    'final_fix_author_image': _target_author,
+    'cleanup_orphan_en_files': _target_orphans,
+    'blog_pipeline': _target_pipeline,
+    'blog_duplicates': _target_duplicates,
+}
+
+
+def _peak_rss_mb():
+    """Peak RSS of this process and its children (pool workers), in MB"""
+    if resource is None:
+        return None
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024  # bytes vs KB
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak / scale, 1)
+
+
+def run_target(name, posts_dir, work_dir):
+    """Child-process side: run one target quietly and print its measurements"""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            TARGETS[name](Path(posts_dir), Path(work_dir))
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+    print(json.dumps({'seconds': wall, 'cpu_seconds': cpu, 'peak_rss_mb': _peak_rss_mb()}))
+
+
+def _run_child(name, posts_dir, work_dir, env):
+    proc = subprocess.run(
+        [sys.executable, __file__, '--run-target', name,
+         '--posts-dir', str(posts_dir), '--work-dir', str(work_dir)],
+        capture_output=True, text=True, encoding='utf-8', env=env
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(name, posts_dir, work_dir, repeat=1, warm_manifest=False):
+    """Run a target in fresh processes and keep the fastest run
+
+    The manifest is off (every run cold) unless warm_manifest, which gives
+    the target a private manifest in work_dir and primes it first.
+    """
+    env = dict(os.environ, SOROKID_MANIFEST='off')
+    if warm_manifest:
+        manifest = Path(work_dir) / f'{name}.manifest.json'
+        manifest.unlink(missing_ok=True)
+        env['SOROKID_MANIFEST'] = str(manifest)
+        _run_child(name, posts_dir, work_dir, env)
+
+    best = None
+    for _ in range(repeat):
+        result = _run_child(name, posts_dir, work_dir, env)
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def compare(results, baseline, threshold):
+    """Print slowdowns vs a saved baseline - returns the number of regressions"""
+    regressions = 0
+    print(f"\n📉 COMPARED TO BASELINE (threshold +{threshold:.0%}):")
+    for size, targets in results.items():
+        for name, result in targets.items():
+            base = baseline.get('results', {}).get(size, {}).get(name)
+            if not base:
+                continue
+            ratio = result['seconds'] / base['seconds'] if base['seconds'] else 1.0
+            flag = '❌' if ratio > 1 + threshold else '✅'
+            regressions += ratio > 1 + threshold
+            print(f"  {flag} {size:>6} {name:<26} {base['seconds']:8.2f}s → "
+                  f"{result['seconds']:8.2f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the blog content scripts')
+    parser.add_argument('--sizes', default='1000',
+                        help='comma-separated VI post counts (e.g. 1000,10000,50000)')
+    parser.add_argument('--targets', default=','.join(TARGETS),
+                        help='comma-separated targets to run')
+    parser.add_argument('--link-density', type=float, default=0.9,
+                        help='share of VI posts with an EN translation')
+    parser.add_argument('--sections', default='10-80',
+                        help='min-max sections per post')
+    parser.add_argument('--missing-rate', type=float, default=0.05,
+                        help='chance of dropping each optional field')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per target, fastest is reported')
+    parser.add_argument('--warm-manifest', action='store_true',
+                        help='time targets against a primed private manifest')
+    parser.add_argument('--keep', metavar='DIR', help='generate corpora into DIR and keep them')
+    parser.add_argument('--save-baseline', metavar='FILE')
+    parser.add_argument('--baseline', metavar='FILE')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='slowdown vs baseline counted as a regression')
+    # Internal: child process mode
+    parser.add_argument('--run-target', help=argparse.SUPPRESS)
+    parser.add_argument('--posts-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_target:
+        run_target(args.run_target, args.posts_dir, args.work_dir)
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    targets = [t for t in args.targets.split(',') if t]
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(unknown)}")
+    min_sections, max_sections = (int(n) for n in args.sections.split('-'))
+
+    print("⏱️  BLOG TOOLS BENCHMARK")
+    print("=" * 60)
+    print(f"Python {sys.version.split()[0]}, JSON backend: {JSON_BACKEND}")
+
+    results = {}
+    for size in sizes:
+        with contextlib.ExitStack() as stack:
+            if args.keep:
+                root = Path(args.keep) / f'corpus-{size}'
+                root.mkdir(parents=True, exist_ok=True)
+            else:
+                root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix='sorokid-bench-')))
+
+            started = time.perf_counter()
+            corpus = generate_corpus(root, size, seed=args.seed,
+                                     link_density=args.link_density,
+                                     min_sections=min_sections, max_sections=max_sections,
+                                     missing_rate=args.missing_rate)
+            files = corpus['vi'] + corpus['en']
+            megabytes = corpus['bytes'] / (1024 * 1024)
+            print(f"\n📚 {size} VI posts: {corpus['vi']} VI + {corpus['en']} EN, "
+                  f"{megabytes:.1f} MB (generated in {time.perf_counter() - started:.1f}s)")
+            print(f"  {'target':<26} {'wall s':>8} {'cpu s':>8} {'files/s':>9} {'MB/s':>7} {'peak MB':>8}")
+
+            results[str(size)] = {}
+            for name in targets:
+                result = measure(name, root / 'posts', root, repeat=args.repeat,
+                                 warm_manifest=args.warm_manifest)
+                result['files'] = files
+                result['bytes'] = corpus['bytes']
+                result['files_per_second'] = files / result['seconds'] if result['seconds'] else None
+                result['mb_per_second'] = megabytes / result['seconds'] if result['seconds'] else None
+                results[str(size)][name] = result
+                peak = result['peak_rss_mb'] if result['peak_rss_mb'] is not None else '-'
+                print(f"  {name:<26} {result['seconds']:8.2f} {result['cpu_seconds']:8.2f} "
+                      f"{result['files_per_second']:9.0f} {result['mb_per_second']:7.1f} {peak:>8}")
+
+    output = {
+        'python': sys.version.split()[0],
+        'json_backend': JSON_BACKEND,
+        'link_density': args.link_density,
+        'sections': args.sections,
+        'seed': args.seed,
+        'manifest': 'warm' if args.warm_manifest else 'off',
+        'results': results,
+    }
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Baseline saved to: {args.save_baseline}")
+
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    print("=" * 60)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
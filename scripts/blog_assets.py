@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Image Assets - Sorokid
+Kiểm tra ảnh `image` của bài blog: ảnh thiếu trong public/, ảnh quá nặng
+(byte hoặc kích thước) và ảnh trong public/blog không bài nào dùng
+
+public/ is indexed once (one directory walk), so each post image resolves
+with a dict lookup. Dimensions come from the file header only (a few bytes
+for PNG/GIF/WebP, the marker chain for JPEG), read in a thread pool.
+
+Usage:
+    python scripts/blog_assets.py [--max-kb 300] [--max-width 1920] [--jobs N]
+"""
+
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from blog_corpus import BASE, VI_POSTS
+
+PUBLIC_DIR = BASE / 'public'
+IMAGE_DIR = 'blog'                  # under PUBLIC_DIR, checked for unused files
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.avif'}
+
+MAX_IMAGE_KB = 300                  # hero images above this hurt page weight
+MAX_IMAGE_WIDTH = 1920
+
+_EXTENSION_FORMATS = {'.jpg': 'jpeg', '.jpeg': 'jpeg', '.png': 'png', '.gif': 'gif',
+                      '.webp': 'webp', '.svg': 'svg', '.avif': 'avif'}
+_SVG_SIZE = re.compile(rb'<svg\b[^>]*?\bwidth="([\d.]+)(?:px)?"[^>]*?\bheight="([\d.]+)(?:px)?"')
+_SVG_VIEWBOX = re.compile(rb'<svg\b[^>]*?\bviewBox="[\d.\-]+[ ,]+[\d.\-]+[ ,]+([\d.]+)[ ,]+([\d.]+)"')
+# JPEG markers carrying the frame size (SOF0-SOF15 except DHT, JPG, DAC)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_size(f):
+    """(width, height) from the first SOF segment, seeking over the others
+    (EXIF/ICC blocks are skipped, not read)"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)            # fill bytes before a marker
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue                    # standalone markers have no length
+        length = f.read(2)
+        if len(length) < 2:
+            return None
+        if marker in _JPEG_SOF:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:5])
+            return width, height
+        f.seek(struct.unpack('>H', length)[0] - 2, os.SEEK_CUR)
+        if f.read(1) != b'\xff':
+            return None
+        f.seek(-1, os.SEEK_CUR)
+
+
+def image_header(path):
+    """(format, width, height) from the file header; unknown parts are None"""
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+            return ('png',) + struct.unpack('>II', head[16:24])
+        if head[:3] == b'\xff\xd8\xff':
+            size = _jpeg_size(f)
+            return ('jpeg',) + (size or (None, None))
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return ('gif',) + struct.unpack('<HH', head[6:10])
+        if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+            chunk = head[12:16]
+            if chunk == b'VP8 ' and len(head) >= 30:
+                width, height = struct.unpack('<HH', head[26:30])
+                return 'webp', width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L' and len(head) >= 25:
+                bits = int.from_bytes(head[21:25], 'little')
+                return 'webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b'VP8X' and len(head) >= 30:
+                return ('webp', int.from_bytes(head[24:27], 'little') + 1,
+                        int.from_bytes(head[27:30], 'little') + 1)
+            return 'webp', None, None
+        if head[4:12] in (b'ftypavif', b'ftypavis'):
+            return 'avif', None, None
+
+        head += f.read(4096)
+        if b'<svg' in head:
+            match = _SVG_SIZE.search(head) or _SVG_VIEWBOX.search(head)
+            if match:
+                return 'svg', round(float(match.group(1))), round(float(match.group(2)))
+            return 'svg', None, None
+    return None, None, None
+
+
+def index_public(public_dir=PUBLIC_DIR):
+    """One walk over public/ - {url path: file path} for every image file"""
+    public_dir = str(public_dir)
+    index = {}
+    for root, _, files in os.walk(public_dir):
+        prefix = os.path.relpath(root, public_dir).replace(os.sep, '/')
+        prefix = '/' if prefix == '.' else f"/{prefix}/"
+        for name in files:
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                index[prefix + name] = os.path.join(root, name)
+    return index
+
+
+def _asset_info(path):
+    """Byte size and header of one image file"""
+    try:
+        size = os.path.getsize(path)
+        fmt, width, height = image_header(path)
+    except OSError as e:
+        return {'error': str(e)}
+    return {'bytes': size, 'format': fmt, 'width': width, 'height': height}
+
+
+def read_assets(paths, jobs=None):
+    """{path: info} for many images; header reads are I/O bound, so threads"""
+    paths = sorted(set(paths))
+    jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return dict(zip(paths, pool.map(_asset_info, paths)))
+
+
+def post_images(posts_dir=None):
+    """[(lang, slug, image)] for posts with a string `image`, from the manifest"""
+    from blog_manifest import load_manifest
+
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    corpus = load_manifest(vi_dir)
+    images = []
+    for lang, entries in (('vi', corpus.vi), ('en', corpus.en)):
+        for _, entry in entries:
+            image = entry.get('header', {}).get('image')
+            if isinstance(image, str) and image.strip():
+                images.append((lang, entry['slug'], image.strip()))
+    return images
+
+
+def check_assets(posts_dir=None, public_dir=PUBLIC_DIR, max_kb=MAX_IMAGE_KB,
+                 max_width=MAX_IMAGE_WIDTH, jobs=None):
+    """Resolve every post image against public/ and measure the files
+
+    Returns {'posts', 'external', 'missing', 'oversized', 'mismatched',
+    'unused', 'assets'}; 'assets' maps url path -> info of the indexed images
+    (public/blog plus those referenced by posts).
+    """
+    index = index_public(public_dir)
+    folded = {}
+    for url in index:
+        folded.setdefault(url.lower(), url)
+
+    images = post_images(posts_dir)
+    used = {}                       # url path -> [(lang, slug)]
+    missing, external = [], 0
+    for lang, slug, image in images:
+        if image.startswith(('http://', 'https://', '//', 'data:')):
+            external += 1
+            continue
+        url = unquote(image.split('?', 1)[0].split('#', 1)[0])
+        if not url.startswith('/'):
+            url = '/' + url
+        if url in index:
+            used.setdefault(url, []).append((lang, slug))
+        else:
+            missing.append((lang, slug, image, folded.get(url.lower())))
+
+    blog_prefix = f"/{IMAGE_DIR}/"
+    urls = set(used) | {url for url in index if url.startswith(blog_prefix)}
+    info = read_assets([index[url] for url in urls], jobs=jobs)
+    assets = {url: info[index[url]] for url in sorted(urls)}
+
+    oversized, mismatched = [], []
+    for url, asset in assets.items():
+        if 'error' in asset:
+            continue
+        too_heavy = asset['bytes'] > max_kb * 1024
+        too_wide = asset['width'] is not None and asset['width'] > max_width
+        if too_heavy or too_wide:
+            oversized.append((url, asset, len(used.get(url, []))))
+        expected = _EXTENSION_FORMATS.get(os.path.splitext(url)[1].lower())
+        if asset['format'] and asset['format'] != expected:
+            mismatched.append((url, asset['format']))
+    oversized.sort(key=lambda item: (-item[1]['bytes'], item[0]))
+
+    return {
+        'posts': len(images),
+        'external': external,
+        'missing': missing,
+        'oversized': oversized,
+        'mismatched': mismatched,
+        'unused': sorted(url for url in urls if url not in used),
+        'assets': assets,
+    }
+
+
+def print_assets(report, max_kb=MAX_IMAGE_KB, max_width=MAX_IMAGE_WIDTH, limit=20):
+    assets = report['assets']
+    total_kb = sum(a.get('bytes', 0) for a in assets.values()) // 1024
+
+    print("🖼️  BLOG IMAGE ASSETS")
+    print("=" * 60)
+    print(f"   Posts with image:  {report['posts']} ({report['external']} external)")
+    print(f"   Images indexed:    {len(assets)} ({total_kb} KB)")
+    print(f"   Missing:           {len(report['missing'])}")
+    print(f"   Oversized:         {len(report['oversized'])} (> {max_kb} KB or > {max_width}px wide)")
+    print(f"   Unused:            {len(report['unused'])}")
+
+    if report['missing']:
+        print(f"\n❌ MISSING IMAGES:")
+        for lang, slug, image, hint in report['missing'][:limit]:
+            note = f" (did you mean {hint}?)" if hint else ""
+            print(f"   - {lang}/{slug}: {image}{note}")
+        if len(report['missing']) > limit:
+            print(f"   ... and {len(report['missing']) - limit} more")
+
+    if report['oversized']:
+        print(f"\n🐘 OVERSIZED IMAGES:")
+        for url, asset, posts in report['oversized'][:limit]:
+            size = f"{asset['width']}x{asset['height']}" if asset['width'] else "?"
+            print(f"   - {url}: {asset['bytes'] // 1024} KB, {size}, used by {posts} posts")
+        if len(report['oversized']) > limit:
+            print(f"   ... and {len(report['oversized']) - limit} more")
+
+    if report['mismatched']:
+        print(f"\n⚠️  EXTENSION DOES NOT MATCH CONTENT:")
+        for url, fmt in report['mismatched']:
+            print(f"   - {url}: {fmt}")
+
+    if report['unused']:
+        print(f"\n🗑️  UNUSED IMAGES IN public/{IMAGE_DIR}:")
+        for url in report['unused'][:limit]:
+            print(f"   - {url}")
+        if len(report['unused']) > limit:
+            print(f"   ... and {len(report['unused']) - limit} more")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def option(name, default=None):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+    def main():
+        max_kb = int(option('--max-kb', MAX_IMAGE_KB))
+        max_width = int(option('--max-width', MAX_IMAGE_WIDTH))
+        jobs = int(option('--jobs', 0)) or None
+
+        report = check_assets(max_kb=max_kb, max_width=max_width, jobs=jobs)
+        print_assets(report, max_kb=max_kb, max_width=max_width)
+        sys.exit(1 if report['missing'] else 0)
+
+    run_profiled(main)
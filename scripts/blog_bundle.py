@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Bundle Builder - Sorokid
+Đóng gói các bài hợp lệ thành 1 artifact cho server: index.json (header
+của mọi bài + offset) và posts.<hash>.bin (body JSON nối liền) - đọc 1 bài chỉ
+cần 1 seek, không phải quét thư mục
+
+posts.<hash>.bin holds one compact JSON document per post followed by a
+newline, VI posts then EN posts, each sorted by slug; <hash> is the start of
+its sha256, and index.json names it in `body`. index.json lists, per locale,
+{slug, offset, length, header} where header is the post without `content`
+(what getAllPosts() returns). The build is deterministic: the same corpus
+always gives byte-identical files.
+
+A rebuild writes the new body file next to the old one, then replaces
+index.json, and only then removes the old body - a reader always gets an
+index and the body it was built with.
+
+Usage:
+    python scripts/blog_bundle.py [--out build/blog-bundle] [--check]
+"""
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+from blog_corpus import BASE, VI_POSTS, iter_post_files
+from blog_io import atomic_writer, atomic_write_bytes, dump_compact_bytes, load_post, loads, read_files
+from validate_blog_json import validate_blog_data
+
+OUT_DIR = BASE / 'build' / 'blog-bundle'
+INDEX_NAME = 'index.json'
+BODY_STAGING = 'posts.partial.bin'
+BODY_HASH_CHARS = 16
+BUNDLE_VERSION = 1
+
+
+def _bundle_posts(posts_dir, lang, skipped):
+    """Yield (slug, body bytes, header) of the valid posts of one directory"""
+    for file_path, raw in read_files(iter_post_files(posts_dir)):
+        try:
+            data = load_post(file_path, raw)
+        except (OSError, ValueError) as e:
+            skipped.append((lang, file_path.stem, str(e)))
+            continue
+        if not isinstance(data, dict):
+            skipped.append((lang, file_path.stem, "top level is not an object"))
+            continue
+
+        result = validate_blog_data(data, is_english=(lang == 'en'))
+        if not result.valid:
+            skipped.append((lang, file_path.stem, str(result.errors[0])))
+            continue
+
+        header = {key: value for key, value in data.items() if key != 'content'}
+        yield file_path.stem, dump_compact_bytes(data), header
+
+
+def build_bundle(posts_dir=None, out_dir=OUT_DIR):
+    """Write posts.<hash>.bin and index.json for the VI + EN posts that validate
+
+    Bodies are streamed to disk one post at a time; only the headers are
+    kept for the index. Returns {'posts', 'bytes', 'skipped', 'out_dir'}.
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    locales = {'vi': [], 'en': []}
+    skipped = []
+    digest = hashlib.sha256()
+    offset = 0
+
+    with atomic_writer(out_dir / BODY_STAGING) as body_file:
+        for lang, posts in (('vi', vi_dir), ('en', vi_dir / 'en')):
+            for slug, body, header in _bundle_posts(posts, lang, skipped):
+                body_file.write(body)
+                body_file.write(b'\n')
+                digest.update(body + b'\n')
+                locales[lang].append({'slug': slug, 'offset': offset,
+                                      'length': len(body), 'header': header})
+                offset += len(body) + 1
+
+    body_name = f"posts.{digest.hexdigest()[:BODY_HASH_CHARS]}.bin"
+    os.replace(out_dir / BODY_STAGING, out_dir / body_name)
+
+    index = {
+        'version': BUNDLE_VERSION,
+        'body': body_name,
+        'bodyBytes': offset,
+        'bodySha256': digest.hexdigest(),
+        'locales': locales,
+    }
+    # The index rename (and its directory fsync) publishes the new body;
+    # old bodies go only after it, open readers keep their mapping
+    atomic_write_bytes(out_dir / INDEX_NAME, dump_compact_bytes(index))
+    for path in out_dir.glob('posts.*bin'):
+        if path.name != body_name:
+            path.unlink()
+
+    return {
+        'posts': {lang: len(entries) for lang, entries in locales.items()},
+        'bytes': offset,
+        'skipped': skipped,
+        'out_dir': out_dir,
+    }
+
+
+class Bundle:
+    """Read side: index in memory, bodies through a memory map"""
+
+    def __init__(self, out_dir=OUT_DIR):
+        out_dir = Path(out_dir)
+        for attempt in range(2):
+            with open(out_dir / INDEX_NAME, 'rb') as f:
+                self.index = loads(f.read())
+            if self.index.get('version') != BUNDLE_VERSION:
+                raise ValueError(f"Unsupported bundle version: {self.index.get('version')}")
+            try:
+                self._file = open(out_dir / self.index['body'], 'rb')
+                break
+            except FileNotFoundError:
+                if attempt:
+                    raise
+                # A rebuild replaced the index and removed this body - reread
+        self.entries = {(lang, entry['slug']): entry
+                        for lang, entries in self.index['locales'].items()
+                        for entry in entries}
+        self._map = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                     if self.index['bodyBytes'] else b'')
+
+    def headers(self, lang):
+        return [entry['header'] for entry in self.index['locales'].get(lang, [])]
+
+    def post(self, lang, slug):
+        """Full post by slug, or None"""
+        entry = self.entries.get((lang, slug))
+        if entry is None:
+            return None
+        start = entry['offset']
+        return loads(self._map[start:start + entry['length']])
+
+    def verify(self):
+        """True if the body file matches the checksum recorded in the index"""
+        return (len(self._map) == self.index['bodyBytes']
+                and hashlib.sha256(self._map).hexdigest() == self.index['bodySha256'])
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+def print_bundle_summary(summary):
+    print("📦 BLOG BUNDLE")
+    print("=" * 60)
+    print(f"   VI posts:  {summary['posts']['vi']}")
+    print(f"   EN posts:  {summary['posts']['en']}")
+    print(f"   Body size: {summary['bytes'] // 1024} KB")
+    if summary['skipped']:
+        print(f"\n⚠️  SKIPPED ({len(summary['skipped'])} invalid):")
+        for lang, slug, reason in summary['skipped']:
+            print(f"   - {lang}/{slug}: {reason}")
+    print(f"\n💾 Bundle: {summary['out_dir']}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def main():
+        out_dir = Path(sys.argv[sys.argv.index('--out') + 1]) if '--out' in sys.argv else OUT_DIR
+        summary = build_bundle(out_dir=out_dir)
+        print_bundle_summary(summary)
+
+        if '--check' in sys.argv:
+            bundle = Bundle(out_dir)
+            ok = bundle.verify() and all(
+                bundle.post(lang, slug) is not None for lang, slug in bundle.entries)
+            bundle.close()
+            print("✅ Bundle verified" if ok else "❌ Bundle verification failed")
+            sys.exit(0 if ok else 1)
+
+    run_profiled(main)
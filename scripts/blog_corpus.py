@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Blog Corpus Index - Sorokid
+Đọc mỗi bài blog một lần và dựng bảng tra liên kết VI/EN
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+from blog_io import load_post, read_files
+from blog_profile import stage
+
+BASE = Path(__file__).parent.parent
+VI_POSTS = BASE / 'content' / 'blog' / 'posts'
+EN_POSTS = VI_POSTS / 'en'
+
+# Files in the posts directory that are not blog posts
+SKIP_STEMS = ['categories', 'categories.en']
+
+
+def iter_post_files(posts_dir):
+    """Yield post JSON files in sorted order, skipping category files"""
+    with stage('glob'):
+        files = sorted(Path(posts_dir).glob('*.json'))
+    for file_path in files:
+        if file_path.stem in SKIP_STEMS:
+            continue
+        yield file_path
+
+
+class Post:
+    """A parsed post kept in memory for multi-stage runs"""
+
+    def __init__(self, path, lang, data=None, error=None):
+        self.path = Path(path)
+        self.lang = lang
+        self.data = data
+        self.error = error          # read/parse error message, data is None
+        self.modified = False       # needs writing back
+        self.key_order = None       # callable reordering keys before writing
+
+    @property
+    def slug(self):
+        return self.path.stem
+
+    @property
+    def is_english(self):
+        return self.lang == 'en'
+
+
+def load_post_file(file_path, lang, raw=None):
+    """Parse one post into a Post (parse errors are kept in post.error)"""
+    try:
+        return Post(file_path, lang, data=load_post(file_path, raw))
+    except json.JSONDecodeError as e:
+        return Post(file_path, lang, error=f"JSON syntax error: {e}")
+    except Exception as e:
+        return Post(file_path, lang, error=f"File error: {e}")
+
+
+def load_posts(posts_dir, lang):
+    """Parse every post in a directory once - returns a sorted list of Post"""
+    return [load_post_file(file_path, lang, raw)
+            for file_path, raw in read_files(iter_post_files(posts_dir))]
+
+
+class CorpusIndex:
+    """Lookup maps for VI/EN translation links, built in one pass
+
+    add_vi/add_en replace what a slug registered before and remove_vi/
+    remove_en drop it, so a long-running process (validate --watch) can
+    keep the index current one file at a time. When several posts claim
+    the same key, the first one added owns it; if it goes away, ownership
+    passes to the next claimant.
+    """
+
+    def __init__(self):
+        self.vi_slugs = set()
+        self.en_slugs = set()
+        self.en_by_post_id = {}           # postId -> EN stem
+        self.vi_by_translation_en = {}    # translations.en -> VI stem
+        self.en_by_translation_vi = {}    # translations.vi -> EN stem
+        self.vi_links = {}                # VI stem -> translations.en
+        self.en_links = {}                # EN stem -> postId / translations.vi
+        self.errors = {}                  # path -> error message
+        self._en_keys = {}                # EN stem -> (postId, translations.vi)
+        self._claimants = {'en_by_post_id': {}, 'vi_by_translation_en': {},
+                           'en_by_translation_vi': {}}   # map -> key -> {stem: None}
+
+    @classmethod
+    def build(cls, vi_dir=VI_POSTS, en_dir=None):
+        """Index the links of every VI and EN post (from the manifest)"""
+        from blog_manifest import load_manifest  # imports this module
+
+        corpus = load_manifest(vi_dir, en_dir)
+        with stage('index'):
+            index = cls()
+            for path, entry in corpus.vi:
+                index.add_vi(entry['slug'], index._header(path, entry))
+            for path, entry in corpus.en:
+                index.add_en(entry['slug'], index._header(path, entry))
+        return index
+
+    @classmethod
+    def from_posts(cls, vi_posts, en_posts):
+        """Index posts that are already in memory (see load_posts)"""
+        index = cls()
+        for post in vi_posts:
+            index.add_vi(post.slug, post.data)
+        for post in en_posts:
+            index.add_en(post.slug, post.data)
+        return index
+
+    def _header(self, path, entry):
+        if 'error' in entry:
+            self.errors[str(path)] = entry['error']
+            return None
+        return entry['header']
+
+    @staticmethod
+    def _translations(data):
+        translations = data.get('translations') if isinstance(data, dict) else None
+        return translations if isinstance(translations, dict) else {}
+
+    def _claim(self, name, key, stem):
+        self._claimants[name].setdefault(key, {})[stem] = None
+        getattr(self, name).setdefault(key, stem)
+
+    def _unclaim(self, name, key, stem):
+        claimants = self._claimants[name].get(key, {})
+        claimants.pop(stem, None)
+        owners = getattr(self, name)
+        if owners.get(key) == stem:
+            if claimants:
+                owners[key] = next(iter(claimants))
+            else:
+                del owners[key]
+        if not claimants:
+            self._claimants[name].pop(key, None)
+
+    def _reclaim(self, name, old, new, stem):
+        if old == new:
+            return
+        if old:
+            self._unclaim(name, old, stem)
+        if new:
+            self._claim(name, new, stem)
+
+    def add_vi(self, vi_slug, data):
+        """Register (or re-register) a VI post (data may be None if unreadable)"""
+        self.vi_slugs.add(vi_slug)
+        en_slug = self._translations(data).get('en')
+        self._reclaim('vi_by_translation_en', self.vi_links.get(vi_slug), en_slug, vi_slug)
+        if en_slug:
+            self.vi_links[vi_slug] = en_slug
+        else:
+            self.vi_links.pop(vi_slug, None)
+
+    def add_en(self, en_slug, data):
+        """Register (or re-register) an EN post (data may be None if unreadable)"""
+        self.en_slugs.add(en_slug)
+        post_id = data.get('postId') if isinstance(data, dict) else None
+        vi_slug = self._translations(data).get('vi')
+        old_post_id, old_vi_slug = self._en_keys.get(en_slug, (None, None))
+        self._reclaim('en_by_post_id', old_post_id, post_id, en_slug)
+        self._reclaim('en_by_translation_vi', old_vi_slug, vi_slug, en_slug)
+        if post_id or vi_slug:
+            self._en_keys[en_slug] = (post_id, vi_slug)
+            self.en_links[en_slug] = post_id or vi_slug
+        else:
+            self._en_keys.pop(en_slug, None)
+            self.en_links.pop(en_slug, None)
+
+    def remove_vi(self, vi_slug):
+        """Forget a VI post (file deleted)"""
+        self.vi_slugs.discard(vi_slug)
+        self._reclaim('vi_by_translation_en', self.vi_links.pop(vi_slug, None), None, vi_slug)
+
+    def remove_en(self, en_slug):
+        """Forget an EN post (file deleted)"""
+        self.en_slugs.discard(en_slug)
+        post_id, vi_slug = self._en_keys.pop(en_slug, (None, None))
+        self._reclaim('en_by_post_id', post_id, None, en_slug)
+        self._reclaim('en_by_translation_vi', vi_slug, None, en_slug)
+        self.en_links.pop(en_slug, None)
+
+    def find_en_for_vi(self, vi_slug):
+        """EN stem whose postId or translations.vi points at this VI slug"""
+        return self.en_by_post_id.get(vi_slug) or self.en_by_translation_vi.get(vi_slug)
+
+    def find_vi_for_en(self, en_slug):
+        """VI stem whose translations.en points at this EN slug"""
+        return self.vi_by_translation_en.get(en_slug)
+
+    def counterparts_of_vi(self, vi_slug):
+        """EN stems linked to a VI post in either direction"""
+        linked = {self.vi_links.get(vi_slug), self.find_en_for_vi(vi_slug)}
+        return {slug for slug in linked if slug in self.en_slugs}
+
+    def counterparts_of_en(self, en_slug):
+        """VI stems linked to an EN post in either direction"""
+        linked = {self.en_links.get(en_slug), self.find_vi_for_en(en_slug)}
+        return {slug for slug in linked if slug in self.vi_slugs}
+
+
+def git_changed_posts(rev, vi_dir=VI_POSTS):
+    """Post files changed since a git revision
+
+    Covers committed, staged, unstaged and untracked changes under the
+    posts directory. Deleted files are dropped. Raises RuntimeError if git fails.
+    """
+    vi_dir = Path(vi_dir).resolve()
+    commands = [
+        ['git', 'diff', '--name-only', '--relative', '-z', rev, '--', '.'],
+        ['git', 'ls-files', '--others', '--exclude-standard', '-z', '--', '.'],
+    ]
+    
+    changed = set()
+    for command in commands:
+        proc = subprocess.run(command, cwd=vi_dir, capture_output=True)
+        if proc.returncode != 0:
+            message = proc.stderr.decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"{' '.join(command[:2])} failed: {message}")
+        for name in proc.stdout.decode('utf-8').split('\0'):
+            path = vi_dir / name
+            if not name.endswith('.json') or not path.exists():
+                continue
+            if path.parent in (vi_dir, vi_dir / 'en') and path.stem not in SKIP_STEMS:
+                changed.add(path)
+    
+    return sorted(changed)
+
+
+def translation_closure(files, index, vi_dir=VI_POSTS):
+    """Expand post files with their linked VI/EN counterparts
+
+    Returns (vi_files, en_files), each sorted.
+    """
+    vi_dir = Path(vi_dir).resolve()
+    en_dir = vi_dir / 'en'
+    vi_stems, en_stems = set(), set()
+    
+    for path in files:
+        path = Path(path).resolve()
+        if path.parent == en_dir:
+            en_stems.add(path.stem)
+            vi_stems |= index.counterparts_of_en(path.stem)
+        elif path.parent == vi_dir:
+            vi_stems.add(path.stem)
+            en_stems |= index.counterparts_of_vi(path.stem)
+    
+    return ([vi_dir / f'{stem}.json' for stem in sorted(vi_stems)],
+            [en_dir / f'{stem}.json' for stem in sorted(en_stems)])
+
+
+def changed_since_closure(rev, vi_dir=VI_POSTS, index=None):
+    """Posts changed since rev plus their translations - (vi_files, en_files)"""
+    changed = git_changed_posts(rev, vi_dir)
+    if not changed:
+        return [], []
+    if index is None:
+        index = CorpusIndex.build(vi_dir)
+    return translation_closure(changed, index, vi_dir)
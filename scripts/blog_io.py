@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+Blog JSON I/O - Sorokid
+Đọc/ghi file bài blog: dùng orjson/ujson nếu có cài (fallback stdlib json),
+bỏ qua ghi nếu nội dung không đổi, ghi atomic
+
+SOROKID_JSON_BACKEND=stdlib|ujson|orjson chọn backend cụ thể.
+SOROKID_READ_JOBS=N số thread đọc file song song (read_files, mặc định 8;
+1 = đọc tuần tự) - có lợi nhất khi content nằm trên ổ mạng.
+"""
+
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import blog_profile
+from blog_profile import count, stage
+
+_PREFERRED = os.environ.get('SOROKID_JSON_BACKEND', '').lower()
+
+orjson = None
+ujson = None
+if _PREFERRED in ('', 'orjson'):
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+if orjson is None and _PREFERRED in ('', 'ujson'):
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+JSON_BACKEND = 'orjson' if orjson else 'ujson' if ujson else 'stdlib'
+
+# orjson only handles 64-bit integers
+_INT_MIN, _INT_MAX = -(2 ** 63), 2 ** 64 - 1
+
+
+def loads(raw):
+    """Parse JSON from bytes (or str)
+
+    Errors are always re-raised by the stdlib parser, so messages and
+    exception types (json.JSONDecodeError, UnicodeDecodeError) match
+    json.load(open(path, encoding='utf-8')).
+    """
+    if isinstance(raw, bytes):
+        if orjson:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        elif ujson:
+            try:
+                return ujson.loads(raw)
+            except ValueError:
+                pass
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
+
+def load_post(path, raw=None):
+    """Read and parse one post file (raw: its bytes if already read)"""
+    if blog_profile.active():
+        return _load_profiled(path, raw)
+    if raw is None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    return loads(raw)
+
+
+def _load_profiled(path, raw=None):
+    """load_post with read/parse timers and per-file numbers (--profile)"""
+    started = time.perf_counter()
+    if raw is None:
+        with stage('read'):
+            with open(path, 'rb') as f:
+                raw = f.read()
+    with stage('parse'):
+        data = loads(raw)
+    blog_profile.record_file(path, time.perf_counter() - started, len(raw))
+    count('files_read')
+    count('bytes_parsed', len(raw))
+    return data
+
+
+READ_JOBS = int(os.environ.get('SOROKID_READ_JOBS') or 8)
+
+
+def _read_bytes(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def read_files(paths, jobs=None):
+    """Yield (path, raw bytes) in the order of paths, reading ahead on a
+    thread pool so slow (network) filesystems overlap their round trips
+
+    raw is None when a file could not be read - load_post(path) then
+    re-raises the real error where the caller already handles it. At most
+    jobs * 4 files are held in memory ahead of the consumer.
+    """
+    jobs = READ_JOBS if jobs is None else jobs
+    if jobs <= 1:
+        for path in paths:
+            yield path, _read_bytes(path)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    window = deque()
+    try:
+        for path in paths:
+            window.append((path, pool.submit(_read_bytes, path)))
+            if len(window) >= jobs * 4:
+                path, future = window.popleft()
+                with stage('read'):
+                    raw = future.result()
+                yield path, raw
+        while window:
+            path, future = window.popleft()
+            with stage('read'):
+                raw = future.result()
+            yield path, raw
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+# Separator before each top-level key in a file written with indent=2:
+# nested keys are indented further and raw newlines never occur inside
+# JSON strings
+_KEY_LINE = b'\n  "'
+
+
+def _loads_header_canonical(raw, fields, all_keys=True):
+    """(header, top-level keys) of a canonical indent=2 post, or None if not canonical
+
+    Key lines are located with bytes.find, so only the wanted values are
+    copied out of raw. Without all_keys the scan stops once every field has
+    been found and keys is None.
+    """
+    close = raw.rfind(b'\n}')
+    if not raw.startswith(b'{' + _KEY_LINE) or close < 0 or raw[close + 2:].strip():
+        return None
+
+    find = raw.find
+    wanted = set(fields)
+    header, keys = {}, []
+    start = 1 + len(_KEY_LINE)
+    while True:
+        separator = find(b'": ', start)
+        line = find(_KEY_LINE, separator, close)
+        end = close if line < 0 else line - 1
+        if separator < 0 or separator > end or (line >= 0 and raw[end] != 0x2C):   # ','
+            return None  # separator inside a value - not our layout
+        key = raw[start:separator].decode('utf-8')
+        keys.append(key)
+        if key in wanted:
+            if '\\' in key:
+                return None  # escaped key name - leave it to the full parser
+            header[key] = loads(raw[separator + 3:end])
+            if not all_keys and len(header) == len(wanted):
+                return header, None
+        if line < 0:
+            break
+        start = line + len(_KEY_LINE)
+
+    if not all_keys:
+        return header, None
+    if any('\\' in key for key in keys):
+        return None
+    # A repeated key keeps its first place (and its last value), like a dict
+    return header, list(dict.fromkeys(keys))
+
+
+def _loads_header(raw, fields, all_keys):
+    try:
+        parsed = _loads_header_canonical(raw, fields, all_keys)
+    except ValueError:
+        parsed = None  # not canonical after all - parse everything
+    if parsed is not None:
+        return parsed
+
+    data = loads(raw)
+    if not isinstance(data, dict):
+        return {}, None
+    return {key: data[key] for key in fields if key in data}, list(data)
+
+
+def loads_header_keys(raw, fields):
+    """Parse only `fields` of a post's top-level object - returns
+    (header dict, list of all top-level keys), keys None if not an object
+
+    Files in the canonical indent=2 layout are scanned for top-level key
+    lines and only the requested values are parsed, so large subtrees such
+    as content.sections are neither copied nor turned into Python objects
+    (nor checked for syntax). Anything else - minified, other indentation,
+    escaped key names - falls back to a full parse, which also raises the
+    usual errors for invalid JSON.
+    """
+    return _loads_header(raw, fields, True)
+
+
+def loads_header(raw, fields):
+    """Parse only `fields` of a post's top-level object (see loads_header_keys);
+    the scan stops at the last wanted key, so a repeated key keeps its first
+    value here"""
+    return _loads_header(raw, fields, False)[0]
+
+
+def _orjson_safe(value):
+    """True if orjson output would be byte-identical to stdlib json for value"""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str) or value is None or value is True or value is False:
+            continue
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    return False
+                stack.append(item)
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, int):
+            if not _INT_MIN <= value <= _INT_MAX:
+                return False
+        elif isinstance(value, float):
+            # Exponent notation (1e+16 vs 1e16) and NaN/Infinity differ
+            if not math.isfinite(value) or 'e' in repr(value):
+                return False
+        else:
+            return False
+    return True
+
+
+def dump_post_bytes(data):
+    """Serialize a post exactly like json.dump(..., ensure_ascii=False, indent=2)"""
+    if orjson and _orjson_safe(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates - let stdlib report it
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def dump_compact_bytes(data):
+    """Serialize like json.dumps(..., ensure_ascii=False, separators=(',', ':'))"""
+    if orjson and _orjson_safe(data):
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _fsync_dir(directory):
+    """Persist the rename itself (no-op where directories can't be opened)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_writer(path):
+    """Binary file for streaming writes; on success it is fsynced and renamed
+    over path, on error the temp file is removed and path is untouched"""
+    path = Path(path)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_dir(path.parent)
+
+
+def atomic_write_bytes(path, payload):
+    """Write bytes via temp file + fsync + rename so readers never see half a file"""
+    with atomic_writer(path) as f:
+        f.write(payload)
+
+
+def write_post(path, data):
+    """Write a post only if its serialized bytes differ from the file on disk
+
+    Returns True when the file was (re)written.
+    """
+    with stage('dump'):
+        payload = dump_post_bytes(data)
+    with stage('write'):
+        try:
+            # Different size means different content - no need to read it
+            if os.stat(path).st_size == len(payload):
+                with open(path, 'rb') as f:
+                    if f.read() == payload:
+                        count('files_unchanged')
+                        return False
+        except FileNotFoundError:
+            pass
+
+        atomic_write_bytes(path, payload)
+    count('files_written')
+    count('bytes_written', len(payload))
+    return True
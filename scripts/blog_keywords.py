@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Keyword Index - Sorokid
+Chỉ mục ngược keyword → bài viết (theo ngôn ngữ) từ keywords + seo.keywords,
+báo cáo keyword bị nhiều bài cùng nhắm (cannibalization) và tra cứu nhanh
+
+Usage:
+    python scripts/blog_keywords.py                      # cannibalization report
+    python scripts/blog_keywords.py --lookup "soroban"   # posts already targeting it
+    options: --fold (bỏ dấu tiếng Việt), --lang vi|en, --min-posts N, --limit N
+"""
+
+import re
+import unicodedata
+from pathlib import Path
+
+from blog_corpus import VI_POSTS
+from blog_manifest import load_manifest
+
+_SPACES = re.compile(r'\s+')
+_EDGE_PUNCTUATION = '.,;:!?"\'“”‘’()[]{}-–—'
+
+
+def fold_diacritics(text):
+    """Remove Vietnamese diacritics: 'học toán' -> 'hoc toan', 'đ' -> 'd'"""
+    text = unicodedata.normalize('NFD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return text.replace('đ', 'd').replace('Đ', 'D')
+
+
+def normalize_keyword(keyword, fold=False):
+    """Lowercase, NFC, single spaces, no surrounding punctuation"""
+    keyword = unicodedata.normalize('NFC', keyword).lower()
+    keyword = _SPACES.sub(' ', keyword).strip(_EDGE_PUNCTUATION + ' ')
+    return fold_diacritics(keyword) if fold else keyword
+
+
+def post_keywords(header):
+    """Raw keywords of a post: keywords[] plus seo.keywords (list or CSV string)"""
+    keywords = header.get('keywords')
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    result = [k for k in keywords or [] if isinstance(k, str)]
+
+    seo = header.get('seo')
+    seo_keywords = seo.get('keywords') if isinstance(seo, dict) else None
+    if isinstance(seo_keywords, str):
+        seo_keywords = seo_keywords.split(',')
+    if isinstance(seo_keywords, list):
+        result.extend(k for k in seo_keywords if isinstance(k, str))
+    return result
+
+
+def build_keyword_index(posts_dir=None, fold=False):
+    """One pass over the manifest - {lang: {keyword: [slug, ...]}}
+
+    Each post is listed once per keyword, in slug order.
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    corpus = load_manifest(vi_dir)
+
+    index = {'vi': {}, 'en': {}}
+    for lang, entries in (('vi', corpus.vi), ('en', corpus.en)):
+        keywords_index = index[lang]
+        for _, entry in entries:
+            header = entry.get('header', {})
+            for keyword in {normalize_keyword(k, fold) for k in post_keywords(header)}:
+                if keyword:
+                    keywords_index.setdefault(keyword, []).append(entry['slug'])
+    return index
+
+
+def find_cannibalized(index, min_posts=2):
+    """{lang: [(keyword, slugs)]} for keywords targeted by >= min_posts posts,
+    most contested first"""
+    report = {}
+    for lang, keywords_index in index.items():
+        shared = [(keyword, slugs) for keyword, slugs in keywords_index.items()
+                  if len(slugs) >= min_posts]
+        shared.sort(key=lambda item: (-len(item[1]), item[0]))
+        report[lang] = shared
+    return report
+
+
+def lookup_keyword(index, query, fold=False, lang=None):
+    """(exact, partial) matches for a query: exact is [(lang, slugs)],
+    partial is [(lang, keyword, slugs)] for keywords containing the query"""
+    query = normalize_keyword(query, fold)
+    exact, partial = [], []
+    for index_lang, keywords_index in index.items():
+        if lang and index_lang != lang:
+            continue
+        if query in keywords_index:
+            exact.append((index_lang, keywords_index[query]))
+        for keyword, slugs in keywords_index.items():
+            if query in keyword and keyword != query:
+                partial.append((index_lang, keyword, slugs))
+    partial.sort(key=lambda item: (item[0], -len(item[2]), item[1]))
+    return exact, partial
+
+
+def print_cannibalization(index, min_posts=2, limit=20, lang=None):
+    print("🔑 KEYWORD CANNIBALIZATION REPORT")
+    print("=" * 60)
+    report = find_cannibalized(index, min_posts)
+    for report_lang, shared in report.items():
+        if lang and report_lang != lang:
+            continue
+        print(f"\n🌐 {report_lang.upper()}: {len(index[report_lang])} keywords, "
+              f"{len(shared)} targeted by {min_posts}+ posts")
+        for i, (keyword, slugs) in enumerate(shared[:limit], 1):
+            print(f"   {i:2}. \"{keyword}\" ({len(slugs)} posts)")
+            for slug in slugs[:5]:
+                print(f"       - {slug}")
+            if len(slugs) > 5:
+                print(f"       ... and {len(slugs) - 5} more")
+        if len(shared) > limit:
+            print(f"   ... and {len(shared) - limit} more keywords")
+    print("=" * 60)
+    return report
+
+
+def print_lookup(index, query, fold=False, lang=None, limit=20):
+    exact, partial = lookup_keyword(index, query, fold, lang)
+    print(f"🔎 \"{query}\"")
+    if exact:
+        for match_lang, slugs in exact:
+            print(f"\n✅ Exact match ({match_lang}, {len(slugs)} posts):")
+            for slug in slugs:
+                print(f"   - {slug}")
+    else:
+        print("\n✅ No post targets this exact keyword yet")
+    if partial:
+        print(f"\n📎 Related keywords ({len(partial)}):")
+        for match_lang, keyword, slugs in partial[:limit]:
+            print(f"   [{match_lang}] \"{keyword}\": {', '.join(slugs[:3])}"
+                  + (f" (+{len(slugs) - 3})" if len(slugs) > 3 else ""))
+        if len(partial) > limit:
+            print(f"   ... and {len(partial) - limit} more")
+    return exact, partial
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def option(name, default=None):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+    def main():
+        fold = '--fold' in sys.argv
+        lang = option('--lang')
+        limit = int(option('--limit', 20))
+        index = build_keyword_index(fold=fold)
+
+        if '--lookup' in sys.argv:
+            print_lookup(index, option('--lookup'), fold=fold, lang=lang, limit=limit)
+        else:
+            print_cannibalization(index, min_posts=int(option('--min-posts', 2)),
+                                  limit=limit, lang=lang)
+
+    run_profiled(main)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Internal Link Graph - Sorokid
+Dựng đồ thị link nội bộ giữa các bài (VI + EN): link hỏng, bài mồ côi
+(không có link trỏ tới) và các bài được link nhiều nhất
+
+Links are extracted once per file version by the corpus manifest (see
+blog_manifest, links=True), so rebuilding the graph only re-reads changed
+posts.
+"""
+
+import re
+from pathlib import Path
+
+from blog_corpus import VI_POSTS
+
+# /blog/<slug>, /en/blog/<slug>: absolute on sorokid.com, or a root-relative
+# path that does not continue a host or another path (so other.com/blog/x
+# and /images/blog/x are not post links). A slug followed by '.' is an
+# image under public/blog, not a post.
+_POST_LINK = re.compile(
+    rb'(?:(?<![\w.-])(?:https?:)?//(?:www\.)?sorokid\.com|(?<![\w.:/%-]))'
+    rb'(/en)?/blog/([a-z0-9][a-z0-9-]*)(?![\w.%-])'
+)
+
+# Stored with the manifest's links - bump when extract_links changes
+LINK_FORMAT = 3
+
+# /blog/<segment> paths that are pages, not posts: category listings
+# (/blog/danh-muc/<slug>, /en/blog/category/<slug> as in app/sitemap.xml/route.js)
+NON_POST_SEGMENTS = {'danh-muc', 'category'}
+
+
+def extract_links(raw, data, lang):
+    """Internal post links of one post - sorted list of [lang, slug]
+
+    raw: file bytes (URLs anywhere: section text, lists, cta.buttonLink...)
+    data: parsed post, for relatedPosts slugs (top level or in content)
+
+    >>> extract_links(b'"/en/blog/category/soroban-for-parents" "/blog/danh-muc/x"'
+    ...               b' "https://sorokid.com/en/blog/abacus-basics"', {}, 'en')
+    [['en', 'abacus-basics']]
+    """
+    links = set()
+    for match in _POST_LINK.finditer(raw):
+        slug = match.group(2).decode('ascii')
+        if slug not in NON_POST_SEGMENTS:
+            links.add(('en' if match.group(1) else 'vi', slug))
+
+    content = data.get('content')
+    for holder in (data, content if isinstance(content, dict) else {}):
+        related = holder.get('relatedPosts')
+        if isinstance(related, list):
+            links.update((lang, slug) for slug in related if isinstance(slug, str))
+
+    return [list(link) for link in sorted(links)]
+
+
+class LinkGraph:
+    """Post -> post links of one post tree, with inbound lists"""
+
+    def __init__(self):
+        self.posts = set()          # (lang, slug)
+        self.outbound = {}          # (lang, slug) -> set of (lang, slug)
+        self.inbound = {}           # (lang, slug) -> set of (lang, slug)
+        self.broken = []            # (source, target) for unknown targets
+        self.unreadable = []        # (lang, slug) the manifest could not parse
+
+    def add_post(self, post, links):
+        self.posts.add(post)
+        self.outbound[post] = {tuple(link) for link in links if tuple(link) != post}
+
+    def resolve(self):
+        """Split links into inbound edges and broken links (one hash lookup each)"""
+        self.inbound = {post: set() for post in self.posts}
+        self.broken = []
+        for source, targets in self.outbound.items():
+            for target in targets:
+                if target in self.inbound:
+                    self.inbound[target].add(source)
+                else:
+                    self.broken.append((source, target))
+        self.broken.sort()
+        return self
+
+    def orphans(self):
+        """Posts nothing links to, sorted"""
+        return sorted(post for post, sources in self.inbound.items() if not sources)
+
+    def hubs(self, limit=10):
+        """Most-linked posts - [(post, inbound count)]"""
+        ranked = sorted(((post, len(sources)) for post, sources in self.inbound.items() if sources),
+                        key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+
+def build_link_graph(posts_dir=None):
+    """Link graph of VI + EN posts from the (incrementally refreshed) manifest"""
+    from blog_manifest import load_manifest
+
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    corpus = load_manifest(vi_dir, links=True)
+
+    graph = LinkGraph()
+    for lang, entries in (('vi', corpus.vi), ('en', corpus.en)):
+        for _, entry in entries:
+            post = (lang, entry['slug'])
+            if 'error' in entry:
+                graph.unreadable.append(post)
+            graph.add_post(post, entry.get('links', []))
+    return graph.resolve()
+
+
+def _post_url(post):
+    lang, slug = post
+    return f"/en/blog/{slug}" if lang == 'en' else f"/blog/{slug}"
+
+
+def print_link_report(graph, limit=20):
+    edges = sum(len(targets) for targets in graph.outbound.values())
+    orphans = graph.orphans()
+
+    print("🔗 INTERNAL LINK REPORT")
+    print("=" * 60)
+    print(f"   Posts:          {len(graph.posts)}")
+    print(f"   Internal links: {edges}")
+    print(f"   Broken links:   {len(graph.broken)}")
+    print(f"   Orphan posts:   {len(orphans)} (no inbound links)")
+    if graph.unreadable:
+        print(f"   Unreadable:     {len(graph.unreadable)} (run validate_blog_json.py)")
+
+    if graph.broken:
+        print(f"\n❌ BROKEN LINKS:")
+        for source, target in graph.broken[:limit]:
+            print(f"   - {source[0]}/{source[1]} → {_post_url(target)}")
+        if len(graph.broken) > limit:
+            print(f"   ... and {len(graph.broken) - limit} more")
+
+    hubs = graph.hubs(limit=10)
+    if hubs:
+        print(f"\n⭐ MOST-LINKED POSTS:")
+        for post, count in hubs:
+            print(f"   {count:3} ← {post[0]}/{post[1]}")
+
+    if orphans:
+        print(f"\n🏝️  ORPHAN POSTS:")
+        for lang, slug in orphans[:limit]:
+            print(f"   - {lang}/{slug}")
+        if len(orphans) > limit:
+            print(f"   ... and {len(orphans) - limit} more")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def main():
+        limit = int(sys.argv[sys.argv.index('--limit') + 1]) if '--limit' in sys.argv else 20
+        graph = build_link_graph()
+        print_link_report(graph, limit=limit)
+        sys.exit(1 if graph.broken else 0)
+
+    run_profiled(main)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Corpus Manifest - Sorokid
+File sidecar ghi header + hash của mọi bài blog, cập nhật tăng dần:
+bài không đổi (mtime + size) không cần mở lại
+
+Entries are built with loads_header, so content.sections is never parsed
+(nor syntax-checked - that is validate_blog_json's job). Internal links
+need the whole post and are only extracted for load_manifest(links=True).
+
+SOROKID_MANIFEST=PATH dùng file manifest khác, SOROKID_MANIFEST=off chỉ giữ
+manifest trong bộ nhớ (benchmark, corpus tạm).
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from blog_corpus import BASE, VI_POSTS, SKIP_STEMS
+from blog_io import atomic_write_bytes, loads, loads_header_keys, read_files
+from blog_links import LINK_FORMAT, extract_links
+from blog_profile import count, run_profiled, stage
+
+_MANIFEST_ENV = os.environ.get('SOROKID_MANIFEST', '')
+MANIFEST_PATH = (None if _MANIFEST_ENV.lower() == 'off'
+                 else Path(_MANIFEST_ENV) if _MANIFEST_ENV
+                 else BASE / 'scripts' / '.blog_manifest.json')
+MANIFEST_VERSION = 3
+
+# Top-level fields copied into each entry (only those the post has)
+HEADER_FIELDS = ['title', 'category', 'status', 'publishedAt', 'postId', 'translations',
+                 'keywords', 'seo', 'image', 'updatedAt', 'createdAt']
+
+
+def _read_entry(file_path, lang, st, links=False):
+    """Build a fresh entry by reading and parsing the file"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return _parse_entry(file_path, lang, st, raw, links)
+
+
+def _parse_entry(file_path, lang, st, raw, links=False):
+    entry = {
+        'lang': lang,
+        'slug': Path(file_path).stem,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'sha256': hashlib.sha256(raw).hexdigest(),
+    }
+    count('manifest_files_parsed')
+    try:
+        header, keys = loads_header_keys(raw, HEADER_FIELDS)
+    except json.JSONDecodeError as e:
+        entry['error'] = f"JSON syntax error: {e}"
+        return entry
+    except ValueError as e:
+        entry['error'] = f"File error: {e}"
+        return entry
+
+    if keys is None:
+        entry['error'] = "File error: top level is not an object"
+        return entry
+    entry['header'] = header
+    entry['keys'] = keys
+    if links:
+        _add_links(entry, raw)
+    return entry
+
+
+def _add_links(entry, raw):
+    """Store the post's internal links - a full parse, relatedPosts may be in content"""
+    count('manifest_links_extracted')
+    try:
+        data = loads(raw)
+    except ValueError:
+        data = None
+    entry['links'] = extract_links(raw, data if isinstance(data, dict) else {}, entry['lang'])
+
+
+class Manifest:
+    """Header + hash of every post, verified against the filesystem by stat
+
+    Entries are keyed by resolved path (like the validation cache), so
+    several post trees can share one manifest file.
+    """
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        manifest = cls(path)
+        if manifest.path is None:
+            return manifest
+        try:
+            with open(manifest.path, 'rb') as f:
+                stored = loads(f.read())
+        except (OSError, ValueError):
+            return manifest
+        if (stored.get('version') == MANIFEST_VERSION and stored.get('fields') == HEADER_FIELDS
+                and stored.get('links') == LINK_FORMAT):
+            manifest.entries = stored.get('files', {})
+        else:
+            manifest.dirty = True
+        return manifest
+
+    def refresh_dir(self, posts_dir, lang, links=False):
+        """Bring entries for one directory up to date - returns them sorted by slug
+
+        Unchanged stat means the entry is reused without opening the file;
+        a changed stat with the same hash only refreshes the stat. links=True
+        also fills in 'links' of entries that do not have them yet.
+        """
+        posts_dir = str(Path(posts_dir).resolve())
+        fresh = {}
+        try:
+            with os.scandir(posts_dir) as it:
+                files = [entry for entry in it
+                         if entry.name.endswith('.json') and entry.is_file()
+                         and entry.name[:-5] not in SKIP_STEMS]
+        except FileNotFoundError:
+            files = []
+
+        # Stat pass first, so the files that need reading go to read_files together
+        stale = {}
+        for dir_entry in files:
+            key = os.path.join(posts_dir, dir_entry.name)
+            st = dir_entry.stat()
+            entry = self.entries.get(key)
+            if (entry and entry['lang'] == lang and entry['mtime_ns'] == st.st_mtime_ns
+                    and entry['size'] == st.st_size
+                    and not (links and 'links' not in entry and 'error' not in entry)):
+                fresh[key] = entry
+            else:
+                stale[key] = st
+
+        for key, raw in read_files(sorted(stale)):
+            st = stale[key]
+            entry = self.entries.get(key)
+            if raw is None:
+                fresh[key] = _read_entry(key, lang, st, links)  # re-raises the read error
+            elif (entry and entry['lang'] == lang
+                    and entry['sha256'] == hashlib.sha256(raw).hexdigest()):
+                # Touched but not changed (or only missing its links)
+                entry['mtime_ns'] = st.st_mtime_ns
+                entry['size'] = st.st_size
+                if links and 'links' not in entry and 'error' not in entry:
+                    _add_links(entry, raw)
+                fresh[key] = entry
+            else:
+                fresh[key] = _parse_entry(key, lang, st, raw, links)
+            self.dirty = True
+
+        # Drop entries for files that are gone from this directory
+        for key in [key for key in self.entries if os.path.dirname(key) == posts_dir]:
+            if key not in fresh:
+                del self.entries[key]
+                self.dirty = True
+        self.entries.update(fresh)
+
+        return [(Path(key), fresh[key]) for key in sorted(fresh)]
+
+    def save(self):
+        """Write the manifest if anything changed (entries of deleted trees are dropped)"""
+        if self.path is None:
+            return
+        for directory in {os.path.dirname(key) for key in self.entries}:
+            if not os.path.isdir(directory):
+                self.entries = {key: entry for key, entry in self.entries.items()
+                                if os.path.dirname(key) != directory}
+                self.dirty = True
+        if not self.dirty:
+            return
+
+        payload = json.dumps({'version': MANIFEST_VERSION, 'fields': HEADER_FIELDS,
+                              'links': LINK_FORMAT, 'files': self.entries}, ensure_ascii=False)
+        atomic_write_bytes(self.path, payload.encode('utf-8'))
+        self.dirty = False
+
+
+class CorpusManifest:
+    """Refreshed VI and EN entries of one post tree"""
+
+    def __init__(self, vi, en):
+        self.vi = vi        # [(path, entry)] sorted by slug
+        self.en = en
+
+
+def load_manifest(vi_dir=VI_POSTS, en_dir=None, path=MANIFEST_PATH, links=False):
+    """Load the manifest, refresh it for one post tree and save it
+
+    path=None keeps it in memory only. links=True makes sure every readable
+    entry has 'links' (see blog_links). Returns a CorpusManifest.
+    """
+    vi_dir = Path(vi_dir)
+    en_dir = Path(en_dir) if en_dir else vi_dir / 'en'
+
+    with stage('manifest'):
+        manifest = Manifest.load(path)
+        corpus = CorpusManifest(manifest.refresh_dir(vi_dir, 'vi', links),
+                                manifest.refresh_dir(en_dir, 'en', links))
+        try:
+            manifest.save()
+        except OSError as e:
+            # stderr: stdout may be an NDJSON stream (validate_blog_json --format ndjson)
+            print(f"⚠️  Could not save manifest {manifest.path}: {e}", file=sys.stderr)
+    return corpus
+
+
+if __name__ == '__main__':
+    def main():
+        if '--rebuild' in sys.argv and MANIFEST_PATH and MANIFEST_PATH.exists():
+            MANIFEST_PATH.unlink()
+
+        corpus = load_manifest()
+        errors = [(path, entry) for path, entry in corpus.vi + corpus.en if 'error' in entry]
+
+        print("📇 BLOG MANIFEST")
+        print("=" * 60)
+        print(f"   VI posts: {len(corpus.vi)}")
+        print(f"   EN posts: {len(corpus.en)}")
+        print(f"   Errors:   {len(errors)}")
+        for path, entry in errors:
+            print(f"   ❌ {path.name}: {entry['error']}")
+        print(f"\n💾 Manifest: {MANIFEST_PATH or 'in memory (SOROKID_MANIFEST=off)'}")
+
+    run_profiled(main)
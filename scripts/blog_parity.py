@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Translation Parity - Sorokid
+So sánh cấu trúc bài VI với bản dịch EN: số section và chuỗi `type`, số FAQ,
+số keyword, category - báo các bản dịch đã lệch cấu trúc (dùng cho CI)
+
+Pairs come from one CorpusIndex (translations / postId, both directions).
+Each post is reduced to its shape once; a pair drifts when a difference goes
+past the limits below. EN translations are rewritten rather than mirrored,
+so small differences are expected and not reported.
+
+Drift that already exists is recorded in scripts/blog_parity_baseline.json;
+the exit code is 1 only for new or worse drift (a diagnostic the pair did
+not have, or the same one further from passing). Refresh the baseline with
+--update-baseline after reviewing the report; --no-baseline fails on any
+drift.
+
+Usage:
+    python scripts/blog_parity.py [--max-section-drift 0.25] [--min-similarity 0.5]
+                                  [--max-faq-diff 2] [--max-keyword-diff 4] [--limit 20]
+                                  [--posts content/blog/posts] [--baseline PATH]
+                                  [--update-baseline | --no-baseline]
+"""
+
+import json
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from blog_corpus import BASE, VI_POSTS, CorpusIndex, load_posts
+from blog_io import atomic_write_bytes
+from blog_rules import Diagnostic, register
+
+# Same mapping as scripts/blog-scaffold-en.js
+CATEGORY_MAP = {
+    'goc-chia-se-giao-vien': 'teacher-insights',
+    'phu-huynh-kem-con-hoc-toan': 'parents-helping-with-math',
+    'con-gap-kho-khan-hoc-toan': 'math-struggles',
+    'cach-giup-con-hoc-toan-nhe-nhang': 'stress-free-math-learning',
+    'soroban-cho-phu-huynh': 'soroban-for-parents',
+}
+
+MAX_SECTION_DRIFT = 0.25            # |VI - EN| / larger section count
+MIN_TYPE_SIMILARITY = 0.5           # SequenceMatcher ratio of the type sequences
+MAX_FAQ_DIFF = 2
+MAX_KEYWORD_DIFF = 4
+
+BASELINE_PATH = BASE / 'scripts' / 'blog_parity_baseline.json'
+
+register('parity-section-count', "Sections: {vi} VI vs {en} EN")
+register('parity-section-types', "Section types only {percent}% alike")
+register('parity-faq-count', "FAQ: {vi} VI vs {en} EN")
+register('parity-keyword-count', "Keywords: {vi} VI vs {en} EN")
+register('parity-category', "Category {vi} maps to {expected}, EN has {en}")
+
+
+def _items(value):
+    return value if isinstance(value, list) else []
+
+
+def post_shape(data):
+    """What parity compares: (section types, FAQ count, keyword count, category)"""
+    content = data.get('content')
+    sections = _items(content.get('sections')) if isinstance(content, dict) else []
+    return (
+        tuple(section.get('type') if isinstance(section, dict) else None for section in sections),
+        len(_items(data.get('faq'))),
+        len(_items(data.get('keywords'))),
+        data.get('category'),
+    )
+
+
+def compare_shapes(vi, en, max_section_drift=MAX_SECTION_DRIFT,
+                   min_similarity=MIN_TYPE_SIMILARITY, max_faq_diff=MAX_FAQ_DIFF,
+                   max_keyword_diff=MAX_KEYWORD_DIFF):
+    """Diagnostics for one VI/EN pair of shapes - [] when they agree"""
+    vi_types, vi_faq, vi_keywords, vi_category = vi
+    en_types, en_faq, en_keywords, en_category = en
+    found = []
+
+    larger = max(len(vi_types), len(en_types))
+    if larger and abs(len(vi_types) - len(en_types)) / larger > max_section_drift:
+        found.append(Diagnostic('parity-section-count', (len(vi_types), len(en_types))))
+    if vi_types != en_types:
+        similarity = SequenceMatcher(None, vi_types, en_types, autojunk=False).ratio()
+        if similarity < min_similarity:
+            found.append(Diagnostic('parity-section-types', (round(similarity * 100),)))
+
+    if abs(vi_faq - en_faq) > max_faq_diff:
+        found.append(Diagnostic('parity-faq-count', (vi_faq, en_faq)))
+    if abs(vi_keywords - en_keywords) > max_keyword_diff:
+        found.append(Diagnostic('parity-keyword-count', (vi_keywords, en_keywords)))
+
+    expected = CATEGORY_MAP.get(vi_category, vi_category)
+    if en_category != expected:
+        found.append(Diagnostic('parity-category', (vi_category, expected, en_category)))
+    return found
+
+
+def check_parity(vi_posts, en_posts, index=None, **limits):
+    """Compare every linked VI/EN pair of loaded posts
+
+    Returns {'pairs', 'unpaired', 'drifted'}; drifted is a list of
+    (vi slug, en slug, [Diagnostic]) with the most diagnostics first.
+    """
+    if index is None:
+        index = CorpusIndex.from_posts(vi_posts, en_posts)
+    en_shapes = {post.slug: post_shape(post.data) for post in en_posts
+                 if isinstance(post.data, dict)}
+
+    pairs, unpaired, drifted = 0, 0, []
+    paired_en = set()
+    for post in vi_posts:
+        if not isinstance(post.data, dict):
+            continue
+        counterparts = [slug for slug in sorted(index.counterparts_of_vi(post.slug))
+                        if slug in en_shapes]
+        if not counterparts:
+            unpaired += 1
+            continue
+        vi_shape = post_shape(post.data)
+        for en_slug in counterparts:
+            pairs += 1
+            paired_en.add(en_slug)
+            found = compare_shapes(vi_shape, en_shapes[en_slug], **limits)
+            if found:
+                drifted.append((post.slug, en_slug, found))
+
+    drifted.sort(key=lambda item: (-len(item[2]), item[0], item[1]))
+    return {
+        'pairs': pairs,
+        'unpaired': unpaired + len(en_shapes.keys() - paired_en),
+        'drifted': drifted,
+    }
+
+
+def _severity(diagnostic):
+    """How far a diagnostic is from passing - larger is worse"""
+    if diagnostic.code == 'parity-section-types':
+        return 100 - diagnostic.args[0]
+    if diagnostic.code == 'parity-category':
+        return 0
+    vi, en = diagnostic.args
+    if diagnostic.code == 'parity-section-count':
+        return abs(vi - en) / max(vi, en)
+    return abs(vi - en)
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Known drift as {(vi slug, en slug): {code: Diagnostic}} - {} without a file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {(item['vi'], item['en']): {d.code: d for d in map(Diagnostic.from_list,
+                                                               item['diagnostics'])}
+            for item in stored['drifted']}
+
+
+def save_baseline(report, path=BASELINE_PATH):
+    """Record the current drift as known (one pair per line, so baseline
+    updates review as line diffs)"""
+    lines = [json.dumps({'vi': vi_slug, 'en': en_slug,
+                         'diagnostics': [d.to_list() for d in found]}, ensure_ascii=False)
+             for vi_slug, en_slug, found in sorted(report['drifted'], key=lambda item: item[:2])]
+    text = '{\n  "drifted": [\n    ' + ',\n    '.join(lines) + '\n  ]\n}\n'
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def compare_baseline(report, baseline):
+    """Split drift against a baseline
+
+    Returns (regressions, resolved): regressions lists (vi slug, en slug,
+    [new or worse Diagnostic]) like report['drifted']; resolved counts
+    baseline pairs that no longer drift.
+    """
+    regressions = []
+    for vi_slug, en_slug, found in report['drifted']:
+        known = baseline.get((vi_slug, en_slug), {})
+        worse = [d for d in found
+                 if d.code not in known or _severity(d) > _severity(known[d.code])]
+        if worse:
+            regressions.append((vi_slug, en_slug, worse))
+    drifting = {(vi_slug, en_slug) for vi_slug, en_slug, _ in report['drifted']}
+    return regressions, len(baseline.keys() - drifting)
+
+
+def print_parity(report, limit=20):
+    counts = {}
+    for _, _, found in report['drifted']:
+        for diagnostic in found:
+            counts[diagnostic.code] = counts.get(diagnostic.code, 0) + 1
+
+    print("🌐 VI ↔ EN STRUCTURAL PARITY")
+    print("=" * 60)
+    print(f"   Pairs compared:  {report['pairs']}")
+    print(f"   Unpaired posts:  {report['unpaired']}")
+    print(f"   Drifted pairs:   {len(report['drifted'])}")
+    for code, count in sorted(counts.items()):
+        print(f"      {code + ':':<22}{count}")
+
+    if report['drifted']:
+        print(f"\n⚠️  DRIFTED TRANSLATIONS:")
+        for vi_slug, en_slug, found in report['drifted'][:limit]:
+            print(f"   - {vi_slug} ↔ en/{en_slug}")
+            for diagnostic in found:
+                print(f"       {diagnostic}")
+        if len(report['drifted']) > limit:
+            print(f"   ... and {len(report['drifted']) - limit} more")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def option(name, default=None):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+    def main():
+        baseline_path = Path(option('--baseline', BASELINE_PATH))
+        limits = {
+            'max_section_drift': float(option('--max-section-drift', MAX_SECTION_DRIFT)),
+            'min_similarity': float(option('--min-similarity', MIN_TYPE_SIMILARITY)),
+            'max_faq_diff': int(option('--max-faq-diff', MAX_FAQ_DIFF)),
+            'max_keyword_diff': int(option('--max-keyword-diff', MAX_KEYWORD_DIFF)),
+        }
+        vi_dir = Path(option('--posts', VI_POSTS))
+        report = check_parity(load_posts(vi_dir, 'vi'), load_posts(vi_dir / 'en', 'en'), **limits)
+        limit = int(option('--limit', 20))
+        print_parity(report, limit=limit)
+
+        if '--update-baseline' in sys.argv:
+            save_baseline(report, baseline_path)
+            print(f"💾 Baseline saved: {len(report['drifted'])} drifted pairs -> {baseline_path}")
+            sys.exit(0)
+        if '--no-baseline' in sys.argv:
+            sys.exit(1 if report['drifted'] else 0)
+
+        regressions, resolved = compare_baseline(report, load_baseline(baseline_path))
+        print(f"\n📌 Compared to baseline ({baseline_path.name}):")
+        print(f"   New or worse drift: {len(regressions)}")
+        print(f"   No longer drifting: {resolved}")
+        for vi_slug, en_slug, found in regressions[:limit]:
+            print(f"   - {vi_slug} ↔ en/{en_slug}")
+            for diagnostic in found:
+                print(f"       {diagnostic}")
+        if len(regressions) > limit:
+            print(f"   ... and {len(regressions) - limit} more")
+        if resolved:
+            print("   Run with --update-baseline to drop resolved pairs")
+        sys.exit(1 if regressions else 0)
+
+    run_profiled(main)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Content Pipeline - Sorokid
+Đọc toàn bộ bài blog một lần, chạy lần lượt: scan trạng thái, fix fields,
+validate, kiểm tra EN orphan, so cấu trúc VI ↔ EN - rồi ghi lại mỗi file
+tối đa một lần
+"""
+
+import sys
+from pathlib import Path
+
+from blog_io import write_post
+from blog_profile import run_profiled, stage
+from blog_corpus import VI_POSTS, CorpusIndex, load_posts
+from scan_blog_status import collect_blog_status, print_blog_status, save_blog_status
+from final_fix_author_image import fix_author
+from batch_fix_vi_files import fix_vi_data, reorder_vi_keys
+from batch_fix_en_files import fix_en_data, reorder_en_keys
+from validate_blog_json import ValidationResult, validate_blog_data
+from cleanup_orphan_en_files import classify_en_files, vi_reference
+from blog_parity import check_parity, print_parity
+
+
+def stage_status(vi_posts, en_posts, report_path=None):
+    """Stage 1 - VI/EN coverage report (scan_blog_status)"""
+    en_by_slug = {p.slug: p.data for p in en_posts if p.data is not None}
+    report = collect_blog_status(
+        ((p.slug, p.data) for p in vi_posts if p.data is not None),
+        en_by_slug.get
+    )
+    print_blog_status(report)
+    save_blog_status(report, report_path)
+    return report
+
+
+def stage_fix(vi_posts, en_posts):
+    """Stage 2 - author, missing fields and translation links"""
+    stats = {'vi_fixed': 0, 'en_fixed': 0}
+    
+    for post in vi_posts + en_posts:
+        if post.data is None:
+            continue
+        modified, changes = fix_author(post.data, post.is_english)
+        if modified:
+            post.modified = True
+            print(f"  [AUTHOR] {post.lang}/{post.slug}: {', '.join(changes)}")
+    
+    index = CorpusIndex.from_posts(vi_posts, en_posts)
+    
+    # EN first: its new postId links are then visible to the VI fixer
+    for posts, fix_data, key_order, add in (
+        (en_posts, fix_en_data, reorder_en_keys, index.add_en),
+        (vi_posts, fix_vi_data, reorder_vi_keys, index.add_vi),
+    ):
+        for post in posts:
+            if post.data is None:
+                continue
+            modified, changes = fix_data(post.data, post.slug, index=index)
+            if not modified:
+                continue
+            post.modified = True
+            post.key_order = key_order
+            add(post.slug, post.data)
+            print(f"  [FIXED] {post.lang}/{post.slug}")
+            for change in changes[:3]:
+                print(f"     + {change}")
+            if len(changes) > 3:
+                print(f"     + ... and {len(changes) - 3} more changes")
+    
+    for post in vi_posts + en_posts:
+        if post.modified:
+            stats[f'{post.lang}_fixed'] += 1
+    
+    print(f"\n  Fixed {stats['vi_fixed']} VI files, {stats['en_fixed']} EN files")
+    return stats
+
+
+def stage_validate(vi_posts, en_posts):
+    """Stage 3 - validate the fixed documents in memory"""
+    summary = {
+        'vi': {'valid': 0, 'invalid': 0},
+        'en': {'valid': 0, 'invalid': 0}
+    }
+    
+    for post in vi_posts + en_posts:
+        result = ValidationResult(str(post.path))
+        if post.data is None:
+            result.add_error('load-error', post.error)
+        else:
+            validate_blog_data(post.data, post.is_english, result)
+        
+        if result.valid:
+            summary[post.lang]['valid'] += 1
+        else:
+            summary[post.lang]['invalid'] += 1
+            print(f"  ❌ {post.lang}/{post.slug}")
+            for err in result.errors[:3]:
+                print(f"      ❌ {err}")
+    
+    print(f"\n   Vietnamese: {summary['vi']['valid']} valid, {summary['vi']['invalid']} invalid")
+    print(f"   English:    {summary['en']['valid']} valid, {summary['en']['invalid']} invalid")
+    return summary
+
+
+def stage_orphans(vi_posts, en_posts):
+    """Stage 4 - EN posts without a matching VI post (report only)"""
+    vi_slugs = {p.slug for p in vi_posts}
+    en_files = {post.path: vi_reference(post.data or {}) for post in en_posts}
+    
+    orphans, matched = classify_en_files(vi_slugs, en_files)
+    
+    print(f"   Matched (1-1):   {len(matched)}")
+    print(f"   Orphans (no VI): {len(orphans)}")
+    for file_path, post_id in sorted(orphans, key=lambda x: x[0].stem):
+        print(f"   - {file_path.stem}")
+        if post_id:
+            print(f"     (references non-existent VI: {post_id})")
+    if orphans:
+        print("   Run cleanup_orphan_en_files.py --delete to remove them")
+    return orphans
+
+
+def stage_parity(vi_posts, en_posts):
+    """Stage 5 - structural drift between VI posts and their translations (report only)"""
+    report = check_parity(vi_posts, en_posts)
+    print_parity(report, limit=10)
+    return report
+
+
+def write_back(posts, dry_run=False):
+    """Write each modified post once (unchanged bytes are not rewritten)"""
+    written = 0
+    for post in posts:
+        if not post.modified:
+            continue
+        data = post.key_order(post.data) if post.key_order else post.data
+        if dry_run or write_post(post.path, data):
+            written += 1
+    return written
+
+
+def run_pipeline(dry_run=False, posts_dir=None, report_path=None):
+    """Parse the corpus once and run every stage over it
+
+    posts_dir: VI posts directory (default content/blog/posts, EN in posts_dir/en)
+    report_path: where the status report is saved (default as scan_blog_status)
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+
+    print("🚀 SOROKID BLOG PIPELINE")
+    print("=" * 60)
+    
+    if dry_run:
+        print("⚠️  DRY RUN MODE - No post files will be modified")
+    
+    with stage('pipeline:load'):
+        vi_posts = load_posts(vi_dir, 'vi')
+        en_posts = load_posts(vi_dir / 'en', 'en')
+    print(f"Loaded {len(vi_posts)} VI + {len(en_posts)} EN posts")
+    
+    print("\n📊 [1/5] STATUS")
+    with stage('pipeline:status'):
+        report = stage_status(vi_posts, en_posts, report_path)
+    
+    print("\n🔧 [2/5] FIX")
+    with stage('pipeline:fix'):
+        fix_stats = stage_fix(vi_posts, en_posts)
+    
+    print("\n🔍 [3/5] VALIDATE")
+    with stage('pipeline:validate'):
+        summary = stage_validate(vi_posts, en_posts)
+    
+    print("\n🗑️  [4/5] ORPHAN EN FILES")
+    with stage('pipeline:orphans'):
+        orphans = stage_orphans(vi_posts, en_posts)
+    
+    print("\n🌐 [5/5] TRANSLATION PARITY")
+    with stage('pipeline:parity'):
+        parity = stage_parity(vi_posts, en_posts)
+    
+    with stage('pipeline:write'):
+        written = write_back(vi_posts + en_posts, dry_run=dry_run)
+    print("\n" + "=" * 60)
+    if dry_run:
+        print(f"💡 Would write {written} files - run without --dry-run to apply")
+    else:
+        print(f"💾 Wrote {written} files")
+    
+    return {
+        'status': report,
+        'fixed': fix_stats,
+        'validation': summary,
+        'orphans': len(orphans),
+        'drifted': len(parity['drifted']),
+        'written': written
+    }
+
+
+if __name__ == '__main__':
+    def main():
+        result = run_pipeline(dry_run='--dry-run' in sys.argv)
+        invalid = result['validation']['vi']['invalid'] + result['validation']['en']['invalid']
+        sys.exit(1 if invalid else 0)
+
+    run_profiled(main)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Blog Script Profiling - Sorokid
+--profile cho mọi script: thời gian wall/CPU theo stage, file chậm nhất /
+lớn nhất, bộ đếm file đọc/ghi và byte, tuỳ chọn dump cProfile
+
+Scripts call stage()/record_file()/count() unconditionally; they are no-ops
+until run_profiled() enables a Profiler, so unprofiled runs pay one global
+lookup per call.
+
+Options (removed from sys.argv before the script parses its own):
+    --profile               print the report to stderr when the script ends
+    --profile-json PATH     also write it as JSON
+    --profile-pstats PATH   also run cProfile and dump pstats to PATH
+    --profile-top N         slowest/largest files listed (default 10)
+
+With validate_blog_json --jobs N, per-file numbers of worker processes are
+not collected; the stage timers still cover the whole run.
+"""
+
+import heapq
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL = nullcontext()
+_active = None
+
+
+class Profiler:
+    """Stage timers, bounded top-N file lists and counters"""
+
+    def __init__(self, top=10):
+        self.top = top
+        self.stages = {}            # name -> [wall, cpu, calls]
+        self.counters = {}
+        self._slowest = []          # min-heaps of (value, path)
+        self._largest = []
+        self._started = (time.perf_counter(), time.process_time())
+
+    @contextmanager
+    def stage(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.stages.setdefault(name, [0.0, 0.0, 0])
+            totals[0] += time.perf_counter() - wall
+            totals[1] += time.process_time() - cpu
+            totals[2] += 1
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_file(self, path, seconds, size):
+        """One file read + parsed; only the top N of each list are kept"""
+        for heap, value in ((self._slowest, seconds), (self._largest, size)):
+            item = (value, str(path))
+            if len(heap) < self.top:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    def report(self):
+        wall, cpu = self._started
+        return {
+            'wall': round(time.perf_counter() - wall, 6),
+            'cpu': round(time.process_time() - cpu, 6),
+            'stages': {name: {'wall': round(w, 6), 'cpu': round(c, 6), 'calls': calls}
+                       for name, (w, c, calls) in self.stages.items()},
+            'counters': dict(self.counters),
+            'slowest_files': [{'path': p, 'seconds': round(s, 6)}
+                              for s, p in sorted(self._slowest, reverse=True)],
+            'largest_files': [{'path': p, 'bytes': b}
+                              for b, p in sorted(self._largest, reverse=True)],
+        }
+
+
+def print_profile(report, out=None):
+    out = out or sys.stderr
+    print("\n⏱️  PROFILE", file=out)
+    print("=" * 60, file=out)
+    print(f"   Total: {report['wall']:.3f}s wall, {report['cpu']:.3f}s CPU", file=out)
+
+    if report['stages']:
+        print(f"\n   {'stage':<20}{'wall':>10}{'cpu':>10}{'calls':>8}", file=out)
+        for name, stage in sorted(report['stages'].items(), key=lambda item: -item[1]['wall']):
+            print(f"   {name:<20}{stage['wall']:>9.3f}s{stage['cpu']:>9.3f}s{stage['calls']:>8}",
+                  file=out)
+    if report['counters']:
+        print("", file=out)
+        for name, value in sorted(report['counters'].items()):
+            print(f"   {name + ':':<18}{value}", file=out)
+    if report['slowest_files']:
+        print("\n   Slowest files:", file=out)
+        for item in report['slowest_files']:
+            print(f"   {item['seconds'] * 1000:8.2f} ms  {os.path.basename(item['path'])}", file=out)
+    if report['largest_files']:
+        print("\n   Largest files:", file=out)
+        for item in report['largest_files']:
+            print(f"   {item['bytes'] // 1024:8} KB  {os.path.basename(item['path'])}", file=out)
+    print("=" * 60, file=out)
+
+
+def active():
+    """The enabled Profiler, or None"""
+    return _active
+
+
+def stage(name):
+    """Time a block as stage `name` (no-op context when profiling is off)"""
+    return _active.stage(name) if _active else _NULL
+
+
+def count(name, amount=1):
+    if _active:
+        _active.count(name, amount)
+
+
+def record_file(path, seconds, size):
+    if _active:
+        _active.record_file(path, seconds, size)
+
+
+def _pop_option(argv, name, has_value=False):
+    """Remove an option from argv - returns its value, True, or None"""
+    if name not in argv:
+        return None
+    i = argv.index(name)
+    if has_value:
+        value = argv[i + 1] if i + 1 < len(argv) else None
+        del argv[i:i + 2]
+        return value
+    del argv[i]
+    return True
+
+
+def run_profiled(main, argv=None):
+    """Run main() with the --profile* options applied (and removed from argv)"""
+    global _active
+    argv = sys.argv if argv is None else argv
+    enabled = _pop_option(argv, '--profile')
+    json_path = _pop_option(argv, '--profile-json', has_value=True)
+    pstats_path = _pop_option(argv, '--profile-pstats', has_value=True)
+    top = _pop_option(argv, '--profile-top', has_value=True)
+    if not (enabled or json_path or pstats_path):
+        return main()
+
+    _active = Profiler(top=int(top) if top else 10)
+    profiler = None
+    if pstats_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        with _active.stage('total'):
+            return main()
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(pstats_path)
+        report = _active.report()
+        _active = None
+        print_profile(report)
+        if json_path:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        if pstats_path:
+            print(f"💾 pstats: {pstats_path} (python -m pstats {pstats_path})", file=sys.stderr)
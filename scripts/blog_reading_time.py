@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Reading Time - Sorokid
+Đếm từ theo cấu trúc section (chỉ phần chữ thật, bỏ key/markup) để ước
+lượng readingTime; chạy trực tiếp để audit readingTime của toàn bộ bài
+
+Basis of the estimate: only reader-visible section text is counted (intro
+plus SECTION_TEXT_FIELDS; FAQ, keys and markup are not), at 150 syllables
+per minute for VI and 200 words per minute for EN, clamped to 5-20 minutes.
+Most readingTime values in the corpus were set by hand on a longer basis
+(12-14 minutes is common where this gives 5-7), so --fix rewrites the
+majority of posts; run without it first and review the list.
+
+Usage:
+    python scripts/blog_reading_time.py [--tolerance 1] [--fix]
+"""
+
+from pathlib import Path
+
+from blog_corpus import VI_POSTS, iter_post_files
+from blog_io import load_post, read_files, write_post
+
+# Reading speed per language (VI is counted in syllables)
+WORDS_PER_MINUTE = {'vi': 150, 'en': 200}
+MIN_MINUTES, MAX_MINUTES = 5, 20
+
+# Fields holding reader-visible text per section type; the rest (type,
+# level, style, URLs) is markup
+SECTION_TEXT_FIELDS = {
+    'heading': ('text',),
+    'paragraph': ('text',),
+    'soft': ('text',),
+    'list': ('items',),
+    'callout': ('title', 'text', 'ctaText'),
+    'table': ('caption', 'headers', 'rows'),
+}
+DEFAULT_TEXT_FIELDS = ('title', 'text', 'items')
+
+
+def section_strings(section):
+    """Reader-visible strings of one section, in field order"""
+    if not isinstance(section, dict):
+        stack = [section]
+    else:
+        fields = SECTION_TEXT_FIELDS.get(section.get('type'), DEFAULT_TEXT_FIELDS)
+        stack = [section[field] for field in reversed(fields) if field in section]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            stack.extend(value[field] for field in reversed(DEFAULT_TEXT_FIELDS) if field in value)
+
+
+def count_words(content):
+    """Words a reader sees in a post's content (intro + sections)"""
+    if isinstance(content, dict):
+        sections = content.get('sections')
+        units = [content.get('intro'), *(sections if isinstance(sections, list) else ())]
+    else:
+        units = [content]
+    return sum(len(text.split()) for unit in units for text in section_strings(unit))
+
+
+def estimate_reading_time(content, lang='vi'):
+    """readingTime in minutes, clamped to MIN_MINUTES..MAX_MINUTES"""
+    minutes = count_words(content) // WORDS_PER_MINUTE[lang]
+    return max(MIN_MINUTES, min(MAX_MINUTES, minutes))
+
+
+def audit_post(file_path, lang, raw=None):
+    """(current, estimated) readingTime of one post (the estimate needs all
+    of content, so this is a full parse; raw: file bytes if already read)"""
+    data = load_post(file_path, raw)
+    return data.get('readingTime'), estimate_reading_time(data.get('content', {}), lang)
+
+
+def audit_reading_time(posts_dir=None, tolerance=1, fix=False):
+    """Compare readingTime of every VI/EN post with the estimate
+
+    tolerance: minutes of difference still accepted
+    fix: rewrite readingTime of posts outside the tolerance
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+
+    print("⏱️  READING TIME AUDIT")
+    print("=" * 60)
+
+    stats = {'total': 0, 'ok': 0, 'off': 0, 'missing': 0, 'errors': 0, 'fixed': 0}
+    off = []
+
+    for posts, lang in ((vi_dir, 'vi'), (vi_dir / 'en', 'en')):
+        for file_path, raw in read_files(iter_post_files(posts)):
+            stats['total'] += 1
+            try:
+                current, estimated = audit_post(file_path, lang, raw)
+            except Exception as e:
+                stats['errors'] += 1
+                print(f"   ❌ {lang}/{file_path.stem}: {e}")
+                continue
+
+            if current is None:
+                stats['missing'] += 1
+            elif not isinstance(current, (int, float)) or abs(current - estimated) > tolerance:
+                stats['off'] += 1
+                off.append((lang, file_path, current, estimated))
+            else:
+                stats['ok'] += 1
+
+    if off:
+        print(f"\n⚠️  READING TIME OFF BY MORE THAN {tolerance} MIN:")
+        for lang, file_path, current, estimated in off:
+            print(f"   - {lang}/{file_path.stem}: {current} -> {estimated}")
+            if fix:
+                data = load_post(file_path)
+                data['readingTime'] = estimated
+                if write_post(file_path, data):
+                    stats['fixed'] += 1
+
+    print("\n" + "=" * 60)
+    print("SUMMARY:")
+    print(f"   Total posts:  {stats['total']}")
+    print(f"   OK:           {stats['ok']}")
+    print(f"   Off:          {stats['off']}")
+    print(f"   Missing:      {stats['missing']} (added by the batch fixers)")
+    print(f"   Errors:       {stats['errors']}")
+    if fix:
+        print(f"   Fixed:        {stats['fixed']}")
+    elif off:
+        print("\nRun with --fix to rewrite readingTime")
+
+    return stats
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def main():
+        tolerance = 1
+        if '--tolerance' in sys.argv:
+            tolerance = int(sys.argv[sys.argv.index('--tolerance') + 1])
+
+        audit_reading_time(tolerance=tolerance, fix='--fix' in sys.argv)
+
+    run_profiled(main)
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Blog Rule Engine - Sorokid
+Luật kiểm tra khai báo dạng bảng, compile một lần thành cây node để mỗi bài
+chỉ cần duyệt một lượt (thêm luật không thêm lượt duyệt)
+
+A path is a tuple of keys from the post root; '[]' means "each item of
+the array", e.g. ('content', 'sections', '[]').
+
+Checks emit Diagnostic records - a stable code plus the values its message
+needs - and the message text is only formatted when a diagnostic is shown.
+"""
+
+import sys
+from operator import itemgetter
+from string import Formatter
+
+ITEMS = '[]'
+
+# code -> (message template, names of the values it uses)
+MESSAGES = {}
+
+
+def register(code, message):
+    """Declare the message of a diagnostic code - returns its value names"""
+    params = tuple(name for _, name, _, _ in Formatter().parse(message) if name)
+    known = MESSAGES.get(code)
+    if known and known[0] != message:
+        raise ValueError(f"Diagnostic code {code!r} already has message {known[0]!r}")
+    MESSAGES[sys.intern(code)] = (message, params)
+    return params
+
+
+class Diagnostic:
+    """One finding: interned code + argument tuple, rendered by str()"""
+
+    __slots__ = ('code', 'args')
+
+    def __init__(self, code, args=()):
+        self.code = sys.intern(code)
+        self.args = args
+
+    def __reduce__(self):
+        # Re-interns the code when results cross a process pool
+        return Diagnostic, (self.code, self.args)
+
+    def __eq__(self, other):
+        return (isinstance(other, Diagnostic)
+                and self.code == other.code and self.args == other.args)
+
+    def __hash__(self):
+        return hash((self.code, self.args))
+
+    def __repr__(self):
+        return f"Diagnostic({self.code!r}, {self.args!r})"
+
+    def __str__(self):
+        message, params = MESSAGES[self.code]
+        return message.format(**dict(zip(params, self.args))) if params else message
+
+    def to_list(self):
+        """JSON form: [code, *args]"""
+        return [self.code, *self.args]
+
+    @classmethod
+    def from_list(cls, item):
+        return cls(item[0], tuple(item[1:]))
+
+
+# Diagnostics without arguments are the same object in every post
+_SHARED = {}
+
+
+def _diagnostic(code, args=()):
+    if args:
+        return Diagnostic(code, args)
+    shared = _SHARED.get(code)
+    if shared is None:
+        shared = _SHARED[code] = Diagnostic(code)
+    return shared
+
+
+class Rule:
+    """One declarative check - build with the helpers below"""
+
+    def __init__(self, kind, path, message, severity='error', fields=(),
+                 limit=None, list_only=False, langs=None, code=None):
+        self.kind = kind
+        self.path = tuple(path)
+        self.message = message
+        self.code = code or message
+        self.params = register(self.code, message)
+        self.severity = severity
+        self.fields = list(fields)
+        self.limit = limit
+        self.list_only = list_only
+        self.langs = langs
+
+    def __repr__(self):
+        return (f"Rule({self.kind!r}, {self.path!r}, {self.message!r}, {self.severity!r}, "
+                f"{self.fields!r}, {self.limit!r}, {self.list_only!r}, {self.langs!r}, "
+                f"{self.code!r})")
+
+
+def present(path, message, langs=None, code=None):
+    """The last key of path must exist in its parent object"""
+    return Rule('present', path, message, langs=langs, code=code)
+
+
+def required(path, fields, message, langs=None, code=None):
+    """Object at path must contain each field ({field} in message)"""
+    return Rule('required', path, message, fields=fields, langs=langs, code=code)
+
+
+def array(path, message, langs=None, code=None):
+    """Value at path must be a list - item rules are skipped otherwise"""
+    return Rule('array', path, message, langs=langs, code=code)
+
+
+def any_of(path, fields, message, langs=None, code=None):
+    """Object at path must contain at least one of fields"""
+    return Rule('any_of', path, message, fields=fields, langs=langs, code=code)
+
+
+def min_count(path, limit, message, severity='warning', list_only=False, langs=None, code=None):
+    """len(value) must be >= limit ({count} in message)"""
+    return Rule('min_count', path, message, severity=severity, limit=limit,
+                list_only=list_only, langs=langs, code=code)
+
+
+def _has(value, field):
+    try:
+        return field in value
+    except TypeError:
+        return False
+
+
+class _Node:
+    """Checks attached to one position in the document tree"""
+
+    def __init__(self):
+        self.missing = []       # (order, severity, diagnostic) when absent in parent
+        self.checks = []        # fn(value, emit, index)
+        self.not_list = None    # (order, severity, diagnostic) from an array rule
+        self.items = None       # _Node applied to each list item
+        self.children = {}      # key -> _Node, in first-declared order
+
+
+def _make_check(order, rule):
+    sev, code, params, fields = rule.severity, rule.code, rule.params, rule.fields
+
+    def diagnostic(**values):
+        return _diagnostic(code, tuple(values[name] for name in params))
+
+    if rule.kind == 'required':
+        def check(value, emit, index):
+            for field in fields:
+                if not _has(value, field):
+                    emit(order, sev, diagnostic(field=field, i=index))
+    elif rule.kind == 'any_of':
+        def check(value, emit, index):
+            if not any(_has(value, field) for field in fields):
+                emit(order, sev, diagnostic(i=index))
+    elif rule.kind == 'min_count':
+        limit, list_only = rule.limit, rule.list_only
+
+        def check(value, emit, index):
+            if list_only and not isinstance(value, list):
+                return
+            try:
+                count = len(value)
+            except TypeError:
+                return
+            if count < limit:
+                emit(order, sev, diagnostic(count=count, i=index))
+    else:
+        raise ValueError(f"Unknown rule kind: {rule.kind}")
+    return check
+
+
+def compile_rules(rules, lang=None):
+    """Compile a rule list for one language into a node tree
+
+    Diagnostics are reported in rule order, whatever order the walk
+    visits nodes in.
+    """
+    root = _Node()
+    for order, rule in enumerate(rules):
+        if rule.langs is not None and lang not in rule.langs:
+            continue
+
+        node = root
+        for key in rule.path:
+            if key == ITEMS:
+                node.items = node.items or _Node()
+                node = node.items
+            else:
+                node = node.children.setdefault(key, _Node())
+
+        if rule.kind == 'present':
+            node.missing.append((order, rule.severity, _diagnostic(rule.code)))
+        elif rule.kind == 'array':
+            node.not_list = (order, rule.severity, _diagnostic(rule.code))
+        else:
+            node.checks.append(_make_check(order, rule))
+    return root
+
+
+def _walk(node, value, emit, index=None):
+    for check in node.checks:
+        check(value, emit, index)
+
+    if node.not_list and not isinstance(value, list):
+        order, sev, diagnostic = node.not_list
+        emit(order, sev, diagnostic)
+    elif node.items and isinstance(value, list):
+        for i, item in enumerate(value):
+            _walk(node.items, item, emit, i)
+
+    if node.children:
+        is_dict = isinstance(value, dict)
+        for key, child in node.children.items():
+            if is_dict and key in value:
+                _walk(child, value[key], emit)
+            else:
+                for order, sev, diagnostic in child.missing:
+                    emit(order, sev, diagnostic)
+
+
+def run_rules(compiled, data):
+    """Walk a document once - returns (errors, warnings) as Diagnostic lists
+    in rule order"""
+    found = []
+    _walk(compiled, data, lambda order, sev, diagnostic: found.append((order, sev, diagnostic)))
+    found.sort(key=itemgetter(0))  # stable: keeps per-rule emission order
+
+    errors = [diagnostic for _, sev, diagnostic in found if sev == 'error']
+    warnings = [diagnostic for _, sev, diagnostic in found if sev != 'error']
+    return errors, warnings
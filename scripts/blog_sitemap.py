@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Sitemap Builder - Sorokid
+Sinh sitemap XML cho các bài đã publish (VI + EN, kèm hreflang alternate)
+từ manifest: chia shard 50k URL, tuỳ chọn gzip, chỉ ghi lại shard đổi
+
+URLs are streamed from the manifest (VI then EN, each in slug order), one
+shard's worth at a time. A shard is fingerprinted from its URL tuples -
+what the manifest headers and today's publish state give, plus
+SITEMAP_FORMAT - before anything is rendered; a shard whose fingerprint
+matches the last run (and whose file exists) is skipped without rendering,
+compressing or writing it, so it keeps its bytes and mtime.
+
+Usage:
+    python scripts/blog_sitemap.py [--gzip] [--out public] [--force]
+"""
+
+import gzip
+import hashlib
+import json
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from blog_corpus import BASE, VI_POSTS
+from blog_io import atomic_writer, atomic_write_bytes, loads
+from blog_manifest import load_manifest
+
+SITE_URL = 'https://sorokid.com'
+OUT_DIR = BASE / 'public'
+STATE_PATH = BASE / 'scripts' / '.blog_sitemap_state.json'
+SHARD_PREFIX = 'sitemap-blog'
+SHARD_URLS = 50000                  # sitemaps.org limit per file
+SITEMAP_FORMAT = 2                  # bump when the rendered XML changes
+
+# Same values as app/sitemap.xml/route.js
+CHANGEFREQ = 'weekly'
+PRIORITY = {'vi': '0.7', 'en': '0.6'}
+
+_URLSET_OPEN = (b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<?xml-stylesheet type="text/xsl" href="/sitemap.xsl"?>\n'
+                b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
+                b'        xmlns:xhtml="http://www.w3.org/1999/xhtml">\n')
+_URLSET_CLOSE = b'</urlset>\n'
+
+
+def post_url(lang, slug):
+    return f"{SITE_URL}/en/blog/{slug}" if lang == 'en' else f"{SITE_URL}/blog/{slug}"
+
+
+def _parse_date(value):
+    """datetime/date of an ISO string ('2026-01-05' or '...T12:00:00.000Z'), else None"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def is_published(header, today=None):
+    """Same rule as lib/blog.js: status 'published' and publishedAt not in the future"""
+    if header.get('status') != 'published':
+        return False
+    published = _parse_date(header.get('publishedAt'))
+    if published is None:
+        return True
+    return published.date() <= (today or date.today())
+
+
+def iter_sitemap_urls(corpus, today=None):
+    """Yield (lang, loc, lastmod, alternates) of every published post, in
+    manifest order
+
+    lastmod is updatedAt, publishedAt or createdAt (first valid one);
+    alternates is a tuple of (hreflang, href) from `translations`.
+    """
+    for lang, entries in (('vi', corpus.vi), ('en', corpus.en)):
+        other = 'vi' if lang == 'en' else 'en'
+        for _, entry in entries:
+            header = entry.get('header')
+            if not header or not is_published(header, today):
+                continue
+            slug = entry['slug']
+            lastmod = next((header[field] for field in ('updatedAt', 'publishedAt', 'createdAt')
+                            if _parse_date(header.get(field))), None)
+
+            alternates = ()
+            translations = header.get('translations')
+            if isinstance(translations, dict) and isinstance(translations.get(other), str):
+                urls = {lang: post_url(lang, slug), other: post_url(other, translations[other])}
+                alternates = (('vi', urls['vi']), ('en', urls['en']), ('x-default', urls['vi']))
+
+            yield lang, post_url(lang, slug), lastmod, alternates
+
+
+def render_url(lang, loc, lastmod, alternates):
+    """One <url> element as UTF-8 bytes"""
+    lines = [f"  <url>\n    <loc>{escape(loc)}</loc>\n"]
+    if lastmod:
+        lines.append(f"    <lastmod>{escape(lastmod)}</lastmod>\n")
+    lines.append(f"    <changefreq>{CHANGEFREQ}</changefreq>\n")
+    lines.append(f"    <priority>{PRIORITY[lang]}</priority>\n")
+    for hreflang, href in alternates:
+        lines.append(f"    <xhtml:link rel=\"alternate\" hreflang=\"{hreflang}\" href={quoteattr(href)}/>\n")
+    lines.append("  </url>\n")
+    return ''.join(lines).encode('utf-8')
+
+
+def _shard_name(number, use_gzip):
+    return f"{SHARD_PREFIX}-{number}.xml" + ('.gz' if use_gzip else '')
+
+
+def shard_fingerprint(urls, salt=''):
+    """(sha256, latest lastmod) of one shard's (lang, loc, lastmod, alternates)
+    tuples - changes whenever its rendered XML would"""
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    latest = ''
+    for url in urls:
+        digest.update(repr(url).encode('utf-8'))
+        lastmod = url[2]
+        if lastmod and lastmod > latest:
+            latest = lastmod
+    return digest.hexdigest(), latest
+
+
+def write_shard(path, urls, use_gzip=False):
+    """Stream (lang, loc, lastmod, alternates) tuples into one <urlset> file"""
+    with atomic_writer(path) as raw:
+        # mtime=0: identical input gives a byte-identical .gz file
+        out = gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) if use_gzip else raw
+        out.write(_URLSET_OPEN)
+        for url in urls:
+            out.write(render_url(*url))
+        out.write(_URLSET_CLOSE)
+        if use_gzip:
+            out.close()                 # writes the gzip trailer, raw stays open
+
+
+def _load_state(path):
+    try:
+        with open(path, 'rb') as f:
+            return loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def build_sitemap(posts_dir=None, out_dir=OUT_DIR, use_gzip=False, shard_size=SHARD_URLS,
+                  state_path=STATE_PATH, force=False, today=None):
+    """Write {SHARD_PREFIX}.xml (sitemap index) and its shards into out_dir
+
+    Only shards whose fingerprint changed (or whose file is missing) are
+    rewritten; shards beyond the new count are deleted. Returns a summary.
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    corpus = load_manifest(vi_dir)
+
+    salt = f"{SITEMAP_FORMAT}|{SITE_URL}|{use_gzip}"
+    key = str(out_dir.resolve())
+    state = _load_state(state_path) if state_path else {}
+    previous = [] if force else state.get(key, [])
+
+    # One pass: each shard takes the next shard_size URLs off the stream;
+    # only shards whose fingerprint changed are rendered
+    urls = iter_sitemap_urls(corpus, today)
+    shards, written = [], []
+    while True:
+        batch = list(islice(urls, shard_size))
+        if not batch:
+            break
+        number = len(shards) + 1
+        path = out_dir / _shard_name(number, use_gzip)
+        digest, latest = shard_fingerprint(batch, salt)
+        if digest != (previous[number - 1] if number <= len(previous) else None) \
+                or not path.exists():
+            write_shard(path, batch, use_gzip)
+            written.append(number)
+        shards.append((digest, len(batch), latest))
+
+    # Shards past the current count, or left over from the other compression
+    names = {_shard_name(number, use_gzip) for number in range(1, len(shards) + 1)}
+    removed = []
+    for path in sorted(out_dir.glob(f"{SHARD_PREFIX}-*.xml*")):
+        if path.name not in names:
+            path.unlink()
+            removed.append(path.name)
+
+    index = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for number, (_, _, latest) in enumerate(shards, 1):
+        index.append(f"  <sitemap>\n    <loc>{SITE_URL}/{_shard_name(number, use_gzip)}</loc>\n")
+        if latest:
+            index.append(f"    <lastmod>{escape(latest)}</lastmod>\n")
+        index.append("  </sitemap>\n")
+    index.append('</sitemapindex>\n')
+    atomic_write_bytes(out_dir / f"{SHARD_PREFIX}.xml", ''.join(index).encode('utf-8'))
+
+    if state_path:
+        state[key] = [digest for digest, _, _ in shards]
+        atomic_write_bytes(state_path, json.dumps(state, indent=2).encode('utf-8'))
+
+    return {
+        'urls': sum(count for _, count, _ in shards),
+        'shards': len(shards),
+        'written': written,
+        'removed': removed,
+        'index': out_dir / f"{SHARD_PREFIX}.xml",
+    }
+
+
+def print_sitemap_summary(summary):
+    print("🗺️  BLOG SITEMAP")
+    print("=" * 60)
+    print(f"   URLs:     {summary['urls']}")
+    print(f"   Shards:   {summary['shards']}")
+    print(f"   Written:  {len(summary['written'])} "
+          f"({', '.join(map(str, summary['written'])) or 'all up to date'})")
+    if summary['removed']:
+        print(f"   Removed:  {', '.join(summary['removed'])}")
+    print(f"\n💾 Index: {summary['index']}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def main():
+        out_dir = Path(sys.argv[sys.argv.index('--out') + 1]) if '--out' in sys.argv else OUT_DIR
+        summary = build_sitemap(out_dir=out_dir, use_gzip='--gzip' in sys.argv,
+                                force='--force' in sys.argv)
+        print_sitemap_summary(summary)
+
+    run_profiled(main)
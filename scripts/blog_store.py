@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blog Content Store - Sorokid
+Xuất bài blog (VI + EN) vào SQLite: bảng posts, sections, faqs, keywords và
+chỉ mục FTS5 tìm kiếm không phân biệt dấu - truy vấn biên tập bằng SQL
+
+Updates are incremental: the manifest tells which files changed (stat, then
+sha256) and only posts whose hash differs from the stored one are re-read
+and replaced.
+
+Usage:
+    python scripts/blog_store.py                          # update the database
+    python scripts/blog_store.py --search "bàn tính"     # full-text search
+    python scripts/blog_store.py --sql "SELECT slug FROM post_sections WHERE type = 'callout'"
+    options: --rebuild, --lang vi|en, --limit N
+"""
+
+import sqlite3
+from pathlib import Path
+
+from blog_corpus import BASE, VI_POSTS
+from blog_duplicates import post_units
+from blog_io import dump_compact_bytes, load_post, read_files
+from blog_keywords import fold_diacritics, normalize_keyword, post_keywords
+from blog_manifest import load_manifest
+from blog_reading_time import section_strings
+
+DB_PATH = BASE / 'scripts' / '.blog_content.db'
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE posts (
+    id INTEGER PRIMARY KEY,
+    lang TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    category TEXT,
+    status TEXT,
+    published_at TEXT,
+    post_id TEXT,
+    translation TEXT,
+    reading_time INTEGER,
+    image TEXT,
+    data TEXT NOT NULL,
+    UNIQUE (lang, slug)
+);
+CREATE TABLE sections (
+    post INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT,
+    text TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (post, position)
+);
+CREATE INDEX sections_type ON sections(type);
+CREATE TABLE faqs (
+    post INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    question TEXT,
+    answer TEXT,
+    PRIMARY KEY (post, position)
+);
+CREATE TABLE keywords (
+    post INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (post, keyword)
+);
+CREATE INDEX keywords_keyword ON keywords(keyword);
+CREATE VIRTUAL TABLE search USING fts5(
+    post UNINDEXED, unit UNINDEXED, original UNINDEXED, text,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# One view joins the slug back in for ad-hoc queries
+VIEWS = """
+CREATE VIEW post_sections AS
+    SELECT p.lang, p.slug, s.position, s.type, s.text, s.data
+    FROM sections s JOIN posts p ON p.id = s.post;
+"""
+
+
+def fold_text(text):
+    """Search form of a text: unicode61 drops combining marks itself, but
+    'đ' is a letter of its own, so it is folded here (index and query alike)"""
+    return fold_diacritics(text).lower()
+
+
+def connect(path=DB_PATH, rebuild=False):
+    """Open the store, (re)creating the schema when missing or outdated"""
+    if rebuild and path != ':memory:' and Path(path).exists():
+        Path(path).unlink()
+    db = sqlite3.connect(str(path))
+    db.execute("PRAGMA foreign_keys = ON")
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        db.close()
+        if path != ':memory:':
+            Path(path).unlink(missing_ok=True)
+        db = sqlite3.connect(str(path))
+        db.execute("PRAGMA foreign_keys = ON")
+        db.executescript(SCHEMA + VIEWS)
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return db
+
+
+def _insert_post(db, lang, slug, sha256, data):
+    """Insert one parsed post and its child rows"""
+    translations = data.get('translations')
+    other = 'vi' if lang == 'en' else 'en'
+    translation = translations.get(other) if isinstance(translations, dict) else None
+    reading_time = data.get('readingTime')
+
+    cursor = db.execute(
+        "INSERT INTO posts (lang, slug, sha256, title, description, category, status,"
+        " published_at, post_id, translation, reading_time, image, data)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (lang, slug, sha256,
+         *(data.get(key) if isinstance(data.get(key), str) else None
+           for key in ('title', 'description', 'category', 'status', 'publishedAt', 'postId')),
+         translation if isinstance(translation, str) else None,
+         reading_time if isinstance(reading_time, int) else None,
+         data.get('image') if isinstance(data.get('image'), str) else None,
+         dump_compact_bytes(data).decode('utf-8')))
+    post = cursor.lastrowid
+
+    content = data.get('content')
+    sections = content.get('sections') if isinstance(content, dict) else None
+    db.executemany(
+        "INSERT INTO sections (post, position, type, text, data) VALUES (?, ?, ?, ?, ?)",
+        ((post, i, section.get('type') if isinstance(section, dict) else None,
+          ' '.join(section_strings(section)), dump_compact_bytes(section).decode('utf-8'))
+         for i, section in enumerate(sections if isinstance(sections, list) else [])))
+
+    faq = data.get('faq')
+    db.executemany(
+        "INSERT INTO faqs (post, position, question, answer) VALUES (?, ?, ?, ?)",
+        ((post, i, item.get('question'), item.get('answer'))
+         for i, item in enumerate(faq if isinstance(faq, list) else [])
+         if isinstance(item, dict)))
+
+    db.executemany(
+        "INSERT OR IGNORE INTO keywords (post, keyword) VALUES (?, ?)",
+        ((post, keyword) for keyword in {normalize_keyword(k) for k in post_keywords(data)}
+         if keyword))
+
+    units = [('title', data['title'])] if isinstance(data.get('title'), str) else []
+    units.extend(post_units(data))
+    db.executemany(
+        "INSERT INTO search (post, unit, original, text) VALUES (?, ?, ?, ?)",
+        ((post, unit, text, fold_text(text)) for unit, text in units if text))
+
+
+def _delete_post(db, post):
+    db.execute("DELETE FROM search WHERE post = ?", (post,))
+    db.execute("DELETE FROM posts WHERE id = ?", (post,))   # cascades to child tables
+
+
+def update_store(db, posts_dir=None):
+    """Bring the store in line with the post files - returns counts
+
+    Posts whose manifest sha256 matches the stored one are not read at all.
+    """
+    vi_dir = Path(posts_dir) if posts_dir else VI_POSTS
+    corpus = load_manifest(vi_dir)
+    stored = {(lang, slug): (post, sha256) for post, lang, slug, sha256
+              in db.execute("SELECT id, lang, slug, sha256 FROM posts")}
+
+    stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0, 'errors': 0}
+    seen = set()
+    changed = {}                        # path -> (lang, entry)
+    for lang, entries in (('vi', corpus.vi), ('en', corpus.en)):
+        for path, entry in entries:
+            key = (lang, entry['slug'])
+            seen.add(key)
+            current = stored.get(key)
+            if current and current[1] == entry['sha256']:
+                stats['unchanged'] += 1
+            elif 'error' in entry:
+                stats['errors'] += 1    # keep the last good version
+            else:
+                changed[path] = (lang, entry)
+
+    with db:
+        for path, raw in read_files(list(changed)):
+            lang, entry = changed[path]
+            try:
+                data = load_post(path, raw)
+            except (OSError, ValueError):
+                stats['errors'] += 1
+                continue
+            current = stored.get((lang, entry['slug']))
+            if current:
+                _delete_post(db, current[0])
+            _insert_post(db, lang, entry['slug'], entry['sha256'], data)
+            stats['updated' if current else 'added'] += 1
+
+        for key, (post, _) in stored.items():
+            if key not in seen:
+                _delete_post(db, post)
+                stats['removed'] += 1
+    return stats
+
+
+def search(db, query, lang=None, limit=20):
+    """Diacritic-insensitive phrase search - [(lang, slug, unit, text)] best first"""
+    phrase = '"' + fold_text(query).replace('"', '""') + '"'
+    sql = ("SELECT p.lang, p.slug, search.unit, search.original FROM search"
+           " JOIN posts p ON p.id = search.post WHERE search MATCH ?")
+    params = [phrase]
+    if lang:
+        sql += " AND p.lang = ?"
+        params.append(lang)
+    sql += " ORDER BY bm25(search) LIMIT ?"
+    params.append(limit)
+    return db.execute(sql, params).fetchall()
+
+
+def print_search(results, query):
+    print(f"🔎 \"{query}\": {len(results)} matches")
+    for lang, slug, unit, text in results:
+        print(f"   - {lang}/{slug} {unit}: {text[:80]}")
+
+
+if __name__ == '__main__':
+    import sys
+
+    from blog_profile import run_profiled
+
+    def option(name, default=None):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+    def main():
+        db = connect(rebuild='--rebuild' in sys.argv)
+        stats = update_store(db)
+
+        if '--search' in sys.argv:
+            print_search(search(db, option('--search'), lang=option('--lang'),
+                                limit=int(option('--limit', 20))), option('--search'))
+        elif '--sql' in sys.argv:
+            cursor = db.execute(option('--sql'))
+            print(' | '.join(column[0] for column in cursor.description or []))
+            for row in cursor.fetchmany(int(option('--limit', 100))):
+                print(' | '.join('' if value is None else str(value) for value in row))
+        else:
+            print("🗄️  BLOG CONTENT STORE")
+            print("=" * 60)
+            for name, count in stats.items():
+                print(f"   {name.capitalize() + ':':11} {count}")
+            print(f"\n💾 Database: {DB_PATH}")
+            print("=" * 60)
+        db.close()
+
+    run_profiled(main)
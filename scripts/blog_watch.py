@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Blog File Watcher - Sorokid
+Theo dõi thay đổi file JSON trong thư mục posts: inotify (Linux, qua ctypes),
+fallback polling bằng stat trên các hệ điều hành khác
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+from blog_corpus import SKIP_STEMS
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def is_post_file(path):
+    """Post JSON files only - skips categories and hidden temp files"""
+    path = Path(path)
+    return (path.suffix == '.json' and not path.name.startswith('.')
+            and path.stem not in SKIP_STEMS)
+
+
+class InotifyWatcher:
+    """Linux inotify watcher on a few directories (non-recursive)"""
+
+    backend = 'inotify'
+
+    def __init__(self, dirs):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = libc.inotify_init1(IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._dirs = {}
+        for directory in dirs:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed: {directory}')
+            self._dirs[wd] = Path(directory)
+
+    def _read(self, timeout):
+        """Changed post paths from one read, or an empty set on timeout"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        buffer = os.read(self._fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if wd in self._dirs and name:
+                path = self._dirs[wd] / os.fsdecode(name)
+                if is_post_file(path):
+                    changed.add(path)
+        return changed
+
+    def changes(self, debounce=0.05):
+        """Yield sets of changed paths; bursts within `debounce` are merged"""
+        while True:
+            changed = self._read(None)
+            while True:
+                more = self._read(debounce)
+                if not more:
+                    break
+                changed |= more
+            if changed:
+                yield changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback - compares mtime/size snapshots every `interval` seconds"""
+
+    backend = 'polling'
+
+    def __init__(self, dirs, interval=0.5):
+        self._dirs = [Path(d) for d in dirs]
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self._dirs:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and is_post_file(entry.name):
+                        st = entry.stat()
+                        snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def changes(self, debounce=0.05):
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed:
+                yield changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(dirs, poll_interval=None):
+    """inotify when available, otherwise polling (or polling when forced)"""
+    if poll_interval is None:
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError):
+            pass  # no inotify on this platform / libc
+    return PollingWatcher(dirs, interval=poll_interval or 0.5)
@@ -4,45 +4,44 @@
 Cleanup orphan EN files - Remove EN posts without matching VI posts
 """
 
-import json
 import os
 from pathlib import Path
 
-def get_vi_slugs():
-    """Get all VI post slugs"""
+from blog_manifest import load_manifest
+from blog_profile import run_profiled
+
+def load_corpus(posts_dir=None):
+    """Manifest of the VI posts and their en/ subdirectory"""
     BASE = Path(__file__).parent.parent
-    VI_POSTS = BASE / 'content' / 'blog' / 'posts'
-    
-    vi_slugs = set()
-    for file_path in VI_POSTS.glob('*.json'):
-        if file_path.stem in ['categories', 'categories.en']:
-            continue
-        vi_slugs.add(file_path.stem)
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
     
-    return vi_slugs
+    return load_manifest(VI_POSTS, VI_POSTS / 'en')
+
+def get_vi_slugs(posts_dir=None, corpus=None):
+    """Get all VI post slugs (corpus: a loaded manifest to reuse)"""
+    if corpus is None:
+        corpus = load_corpus(posts_dir)
+    return {entry['slug'] for _, entry in corpus.vi}
 
-def get_en_files_mapping():
+def vi_reference(data):
+    """VI slug an EN post points at: postId, else translations.vi"""
+    translations = data.get('translations')
+    vi_ref = translations.get('vi') if isinstance(translations, dict) else None
+    return data.get('postId') or vi_ref
+
+def get_en_files_mapping(posts_dir=None, corpus=None):
     """Get EN files and their postId (VI slug reference)"""
-    BASE = Path(__file__).parent.parent
-    EN_POSTS = BASE / 'content' / 'blog' / 'posts' / 'en'
+    if corpus is None:
+        corpus = load_corpus(posts_dir)
     
     en_files = {}
-    for file_path in EN_POSTS.glob('*.json'):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            post_id = data.get('postId') or data.get('translations', {}).get('vi')
-            en_files[file_path] = post_id
-        except:
-            en_files[file_path] = None
+    for file_path, entry in corpus.en:
+        en_files[file_path] = vi_reference(entry.get('header', {}))
     
     return en_files
 
-def find_orphan_en_files():
-    """Find EN files that don't have corresponding VI files"""
-    vi_slugs = get_vi_slugs()
-    en_files = get_en_files_mapping()
-    
+def classify_en_files(vi_slugs, en_files):
+    """Split {EN path: postId} into (orphans, matched) against VI slugs"""
     orphans = []
     matched = []
     
@@ -52,13 +51,23 @@ def find_orphan_en_files():
         else:
             orphans.append((file_path, post_id))
     
+    return orphans, matched
+
+def find_orphan_en_files(posts_dir=None):
+    """Find EN files that don't have corresponding VI files"""
+    corpus = load_corpus(posts_dir)
+    vi_slugs = get_vi_slugs(corpus=corpus)
+    en_files = get_en_files_mapping(corpus=corpus)
+    
+    orphans, matched = classify_en_files(vi_slugs, en_files)
+    
     return orphans, matched, vi_slugs
 
-def main(dry_run=True, delete=False):
+def main(dry_run=True, delete=False, posts_dir=None):
     print("CLEANUP ORPHAN EN FILES")
     print("=" * 60)
     
-    orphans, matched, vi_slugs = find_orphan_en_files()
+    orphans, matched, vi_slugs = find_orphan_en_files(posts_dir)
     
     print(f"\n📊 SUMMARY:")
     print(f"   Total VI posts: {len(vi_slugs)}")
@@ -89,6 +98,5 @@ def main(dry_run=True, delete=False):
 
 if __name__ == '__main__':
     import sys
-    dry_run = '--delete' not in sys.argv
     delete = '--delete' in sys.argv
-    main(dry_run=dry_run, delete=delete)
+    run_profiled(lambda: main(dry_run=not delete, delete=delete))
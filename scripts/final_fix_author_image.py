@@ -4,9 +4,11 @@
 Final Fix - Add missing author/image fields to all blog posts
 """
 
-import json
 from pathlib import Path
 
+from blog_io import load_post, read_files, write_post
+from blog_profile import run_profiled
+
 DEFAULT_AUTHOR = {
     "name": "Minh Anh",
     "bio": "Mẹ của 2 bé, đang đồng hành cùng con học toán tư duy"
@@ -18,16 +20,9 @@ DEFAULT_AUTHOR_EN = {
 }
 
 
-def fix_file(file_path, is_english=False):
-    """Fix missing author field only - DO NOT touch image/imageAlt"""
+def fix_author(data, is_english=False):
+    """Add missing author to a parsed post - returns (modified, changes)"""
     changes = []
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        return False, [f"Error reading: {e}"]
-    
     modified = False
     
     # Fix missing author ONLY
@@ -38,16 +33,27 @@ def fix_file(file_path, is_english=False):
     
     # DO NOT modify image or imageAlt - keep existing values
     
+    return modified, changes
+
+
+def fix_file(file_path, is_english=False, raw=None):
+    """Fix missing author field only - DO NOT touch image/imageAlt"""
+    try:
+        data = load_post(file_path, raw)
+    except Exception as e:
+        return False, [f"Error reading: {e}"]
+    
+    modified, changes = fix_author(data, is_english)
+    
     if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_post(file_path, data)
     
     return modified, changes
 
 
-def main():
+def main(posts_dir=None):
     BASE = Path(__file__).parent.parent
-    VI_POSTS = BASE / 'content' / 'blog' / 'posts'
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
     EN_POSTS = VI_POSTS / 'en'
     
     print("FINAL FIX - Author/Image Fields")
@@ -57,18 +63,18 @@ def main():
     
     # Fix VI files
     print("\n📚 Vietnamese Posts:")
-    for file_path in sorted(VI_POSTS.glob('*.json')):
-        if file_path.stem in ['categories', 'categories.en']:
-            continue
-        modified, changes = fix_file(file_path, is_english=False)
+    vi_files = [p for p in sorted(VI_POSTS.glob('*.json'))
+                if p.stem not in ['categories', 'categories.en']]
+    for file_path, raw in read_files(vi_files):
+        modified, changes = fix_file(file_path, is_english=False, raw=raw)
         if modified:
             stats['vi_fixed'] += 1
             print(f"  [FIXED] {file_path.stem}: {', '.join(changes)}")
     
     # Fix EN files
     print("\n📚 English Posts:")
-    for file_path in sorted(EN_POSTS.glob('*.json')):
-        modified, changes = fix_file(file_path, is_english=True)
+    for file_path, raw in read_files(sorted(EN_POSTS.glob('*.json'))):
+        modified, changes = fix_file(file_path, is_english=True, raw=raw)
         if modified:
             stats['en_fixed'] += 1
             print(f"  [FIXED] {file_path.stem}: {', '.join(changes)}")
@@ -78,4 +84,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_profiled(main)
@@ -8,12 +8,15 @@ Quét tất cả bài blog VI và kiểm tra trạng thái EN
 import json
 from pathlib import Path
 
-def scan_blog_status():
-    # Paths
-    BASE = Path(__file__).parent.parent
-    VI_POSTS = BASE / 'content' / 'blog' / 'posts'
-    EN_POSTS = VI_POSTS / 'en'
+from blog_manifest import load_manifest
+from blog_profile import run_profiled
 
+def collect_blog_status(vi_posts, get_en_post):
+    """Build the status report from parsed posts
+
+    vi_posts: iterable of (vi_slug, data) in report order
+    get_en_post: en_slug -> parsed EN data, or None if there is no EN file
+    """
     # Stats
     total_vi = 0
     has_en = 0
@@ -21,27 +24,15 @@ def scan_blog_status():
     need_update = []
     en_missing_fields = []
 
-    print("📊 SOROKID BLOG STATUS REPORT")
-    print("=" * 60)
-    
-    # Scan VI posts
-    for vi_file in sorted(VI_POSTS.glob('*.json')):
-        if vi_file.stem in ['categories', 'categories.en']:
-            continue
+    for vi_slug, data in vi_posts:
         total_vi += 1
         
-        with open(vi_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
         en_slug = data.get('translations', {}).get('en')
+        en_data = get_en_post(en_slug) if en_slug else None
         if en_slug:
-            en_path = EN_POSTS / f'{en_slug}.json'
-            if en_path.exists():
+            if en_data is not None:
                 has_en += 1
                 # Check if EN needs update (missing fields)
-                with open(en_path, 'r', encoding='utf-8') as f:
-                    en_data = json.load(f)
-                
                 missing = []
                 if 'faq' not in en_data:
                     missing.append('faq')
@@ -61,26 +52,40 @@ def scan_blog_status():
                     })
             else:
                 missing_en.append({
-                    'vi_slug': vi_file.stem,
+                    'vi_slug': vi_slug,
                     'en_slug': en_slug,
                     'title': data.get('title', 'N/A')
                 })
         else:
             missing_en.append({
-                'vi_slug': vi_file.stem,
+                'vi_slug': vi_slug,
                 'en_slug': None,
                 'title': data.get('title', 'N/A')
             })
 
+    coverage = (has_en / total_vi * 100) if total_vi > 0 else 0
+    
+    return {
+        'total_vi': total_vi,
+        'has_en': has_en,
+        'missing_en': missing_en,
+        'en_missing_fields': en_missing_fields,
+        'coverage_percent': coverage
+    }
+
+
+def print_blog_status(report):
+    """Print the status report summary and top items"""
+    missing_en = report['missing_en']
+    en_missing_fields = report['en_missing_fields']
+    
     # Print Results
     print(f"\n📈 SUMMARY:")
-    print(f"   Total VI posts:     {total_vi}")
-    print(f"   Has EN version:     {has_en}")
+    print(f"   Total VI posts:     {report['total_vi']}")
+    print(f"   Has EN version:     {report['has_en']}")
     print(f"   Missing EN:         {len(missing_en)}")
     print(f"   EN needs update:    {len(en_missing_fields)}")
-    
-    coverage = (has_en / total_vi * 100) if total_vi > 0 else 0
-    print(f"   Coverage:           {coverage:.1f}%")
+    print(f"   Coverage:           {report['coverage_percent']:.1f}%")
     
     if missing_en:
         print(f"\n❌ MISSING EN TRANSLATIONS ({len(missing_en)}):")
@@ -97,24 +102,53 @@ def scan_blog_status():
             print(f"       Missing: {', '.join(item['missing'])}")
         if len(en_missing_fields) > 10:
             print(f"   ... and {len(en_missing_fields) - 10} more")
-    
-    # Export to JSON for further processing
-    report = {
-        'total_vi': total_vi,
-        'has_en': has_en,
-        'missing_en': missing_en,
-        'en_missing_fields': en_missing_fields,
-        'coverage_percent': coverage
-    }
-    
-    report_path = BASE / 'scripts' / 'blog_status_report.json'
+
+
+def save_blog_status(report, report_path=None):
+    """Export to JSON for further processing"""
+    BASE = Path(__file__).parent.parent
+    report_path = report_path or BASE / 'scripts' / 'blog_status_report.json'
     with open(report_path, 'w', encoding='utf-8') as f:
         json.dump(report, f, ensure_ascii=False, indent=2)
     
     print(f"\n💾 Report saved to: {report_path}")
+    return report_path
+
+
+def scan_blog_status(posts_dir=None, report_path=None):
+    # Paths
+    BASE = Path(__file__).parent.parent
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
+    EN_POSTS = VI_POSTS / 'en'
+
+    print("📊 SOROKID BLOG STATUS REPORT")
+    print("=" * 60)
+    
+    corpus = load_manifest(VI_POSTS, EN_POSTS)
+    en_entries = {entry['slug']: (path, entry) for path, entry in corpus.en}
+    
+    def iter_vi_posts():
+        for vi_file, entry in corpus.vi:
+            if 'error' in entry:
+                raise ValueError(f"{vi_file.name}: {entry['error']}")
+            yield vi_file.stem, entry['header']
+    
+    def get_en_post(en_slug):
+        if en_slug not in en_entries:
+            return None
+        en_path, entry = en_entries[en_slug]
+        if 'error' in entry:
+            raise ValueError(f"{en_path.name}: {entry['error']}")
+        # The report only checks which keys an EN post has
+        return dict.fromkeys(entry['keys'])
+    
+    # Scan VI posts
+    report = collect_blog_status(iter_vi_posts(), get_en_post)
+    print_blog_status(report)
+    save_blog_status(report, report_path)
     print("=" * 60)
     
     return report
 
 if __name__ == '__main__':
-    scan_blog_status()
+    run_profiled(scan_blog_status)
@@ -5,10 +5,23 @@ Validate Blog JSON - Sorokid
 Kiểm tra tính hợp lệ của file JSON blog
 """
 
+import argparse
+import hashlib
 import json
+import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from blog_corpus import CorpusIndex, changed_since_closure, load_post_file, load_posts
+from blog_io import atomic_write_bytes, load_post, loads, read_files
+from blog_profile import run_profiled, stage
+import blog_rules
+from blog_rules import (ITEMS, Diagnostic, any_of, array, compile_rules, min_count, present,
+                        register, required, run_rules)
+
 # Required fields for Vietnamese posts
 VI_REQUIRED_FIELDS = [
     'slug', 'title', 'description', 'category', 'keywords',
@@ -36,183 +49,377 @@ SEO_REQUIRED = ['title', 'description', 'keywords']
 # Schema structure requirements
 SCHEMA_REQUIRED = ['type', 'datePublished', 'author']
 
+# Declarative rule set, in reporting order - compiled once per language
+# into a single-pass walk (see blog_rules)
+# Codes are stable identifiers for tools that aggregate results; the
+# messages are only formatted for display
+RULES = [
+    # 1. Required fields
+    required((), VI_REQUIRED_FIELDS, "Missing required field: {field}", langs=['vi'],
+             code='missing-field'),
+    required((), EN_REQUIRED_FIELDS, "Missing required field: {field}", langs=['en'],
+             code='missing-field'),
+    
+    # 2. Content structure
+    present(('content',), "Missing 'content' object", code='content-missing'),
+    required(('content',), CONTENT_REQUIRED, "Missing content.{field}",
+             code='content-field-missing'),
+    array(('content', 'sections'), "content.sections must be an array",
+          code='sections-not-array'),
+    required(('content', 'sections', ITEMS), ['type'], "Section {i} missing '{field}' field",
+             code='section-field-missing'),
+    
+    # 3. FAQ structure
+    present(('faq',), "Missing 'faq' array at root level", code='faq-missing'),
+    array(('faq',), "'faq' must be an array", code='faq-not-array'),
+    required(('faq', ITEMS), ['question', 'answer'], "FAQ {i} missing '{field}'",
+             code='faq-field-missing'),
+    
+    # 4. CTA structure
+    present(('cta',), "Missing 'cta' object", code='cta-missing'),
+    required(('cta',), CTA_REQUIRED, "Missing cta.{field}", code='cta-field-missing'),
+    
+    # 5. SEO structure - either old (title/description) or new (metaTitle/metaDescription) format
+    present(('seo',), "Missing 'seo' object", code='seo-missing'),
+    any_of(('seo',), ['title', 'description', 'metaTitle', 'metaDescription'],
+           "SEO must have title/metaTitle and description/metaDescription",
+           code='seo-title-description-missing'),
+    required(('seo',), ['keywords'], "Missing seo.{field}", code='seo-field-missing'),
+    
+    # 6. Schema (English only)
+    present(('schema',), "Missing 'schema' object", langs=['en'], code='schema-missing'),
+    required(('schema',), SCHEMA_REQUIRED, "Missing schema.{field}", langs=['en'],
+             code='schema-field-missing'),
+    
+    # 7. Quality warnings
+    min_count(('keywords',), 5, "Only {count} keywords (recommend 8-12)", code='few-keywords'),
+    min_count(('faq',), 5, "Only {count} FAQs (recommend 8-10)", list_only=True,
+              code='few-faqs'),
+    min_count(('content', 'sections'), 30, "Only {count} sections (recommend 50+)",
+              code='few-sections'),
+]
 
-def validate_json_syntax(file_path):
-    """Check if file is valid JSON"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return True, data, None
-    except json.JSONDecodeError as e:
-        return False, None, f"JSON syntax error: {e}"
-    except Exception as e:
-        return False, None, f"File error: {e}"
+# Diagnostics raised before the rules run
+register('json-syntax', "JSON syntax error: {error}")
+register('file-error', "File error: {error}")
+register('load-error', "{error}")       # Post.error, already formatted
 
+_COMPILED_RULES = {}
 
-def validate_required_fields(data, required_fields, context=""):
-    """Check if all required fields exist"""
-    errors = []
-    for field in required_fields:
-        if field not in data:
-            errors.append(f"Missing required field: {context}{field}")
-    return errors
 
+def compiled_rules(lang):
+    """RULES compiled for 'vi' or 'en' (cached)"""
+    if lang not in _COMPILED_RULES:
+        _COMPILED_RULES[lang] = compile_rules(RULES, lang)
+    return _COMPILED_RULES[lang]
 
-def validate_content_structure(data):
-    """Validate content object structure"""
-    errors = []
-    
-    if 'content' not in data:
-        return ["Missing 'content' object"]
-    
-    content = data['content']
-    
-    # Check required content fields
-    for field in CONTENT_REQUIRED:
-        if field not in content:
-            errors.append(f"Missing content.{field}")
-    
-    # Validate sections array
-    if 'sections' in content:
-        if not isinstance(content['sections'], list):
-            errors.append("content.sections must be an array")
-        else:
-            for i, section in enumerate(content['sections']):
-                if 'type' not in section:
-                    errors.append(f"Section {i} missing 'type' field")
-                    
-    return errors
 
+# Persistent per-file results cache (see ValidationCache)
+CACHE_PATH = Path(__file__).parent / '.validate_blog_cache.json'
+CACHE_VERSION = 2
 
-def validate_faq_structure(data):
-    """Validate FAQ array structure"""
-    errors = []
-    
-    if 'faq' not in data:
-        return ["Missing 'faq' array at root level"]
-    
-    faq = data['faq']
-    
-    if not isinstance(faq, list):
-        return ["'faq' must be an array"]
-    
-    for i, item in enumerate(faq):
-        if 'question' not in item:
-            errors.append(f"FAQ {i} missing 'question'")
-        if 'answer' not in item:
-            errors.append(f"FAQ {i} missing 'answer'")
-    
-    return errors
 
+class ValidationResult:
+    """Outcome of validating one post - errors/warnings are Diagnostic lists"""
 
-def validate_cta_structure(data):
-    """Validate CTA object structure"""
-    errors = []
-    
-    if 'cta' not in data:
-        return ["Missing 'cta' object"]
-    
-    cta = data['cta']
-    
-    for field in CTA_REQUIRED:
-        if field not in cta:
-            errors.append(f"Missing cta.{field}")
-    
-    return errors
+    __slots__ = ('file', 'valid', 'errors', 'warnings')
 
+    def __init__(self, file=None, errors=None, warnings=None):
+        self.file = file
+        self.errors = errors if errors is not None else []
+        self.warnings = warnings if warnings is not None else []
+        self.valid = not self.errors
 
-def validate_seo_structure(data):
-    """Validate SEO object structure"""
-    errors = []
-    
-    if 'seo' not in data:
-        return ["Missing 'seo' object"]
-    
-    seo = data['seo']
-    
-    # Check for either old format (title/description) or new format (metaTitle/metaDescription)
-    has_old_format = 'title' in seo or 'description' in seo
-    has_new_format = 'metaTitle' in seo or 'metaDescription' in seo
-    
-    if not has_old_format and not has_new_format:
-        errors.append("SEO must have title/metaTitle and description/metaDescription")
-    
-    if 'keywords' not in seo:
-        errors.append("Missing seo.keywords")
-    
-    return errors
+    def __reduce__(self):
+        return ValidationResult, (self.file, self.errors, self.warnings)
 
+    def add_error(self, code, *args):
+        self.errors.append(Diagnostic(code, args))
+        self.valid = False
 
-def validate_blog_json(file_path, is_english=False):
-    """Main validation function"""
-    results = {
-        'file': str(file_path),
-        'valid': True,
-        'errors': [],
-        'warnings': []
-    }
+    def error_messages(self):
+        return [str(d) for d in self.errors]
+
+    def warning_messages(self):
+        return [str(d) for d in self.warnings]
+
+    def to_cache(self):
+        """JSON form without the file path: {'errors': [[code, *args]], ...}"""
+        return {'errors': [d.to_list() for d in self.errors],
+                'warnings': [d.to_list() for d in self.warnings]}
+
+    @classmethod
+    def from_cache(cls, stored, file=None):
+        return cls(file, [Diagnostic.from_list(d) for d in stored['errors']],
+                   [Diagnostic.from_list(d) for d in stored['warnings']])
+
+
+def validate_json_syntax(file_path, raw=None):
+    """Check if file is valid JSON (raw: file bytes if already read)
+
+    Returns (ok, data, (code, message)) - the last item is None when ok.
+    """
+    try:
+        data = load_post(file_path, raw)
+        return True, data, None
+    except json.JSONDecodeError as e:
+        return False, None, ('json-syntax', str(e))
+    except Exception as e:
+        return False, None, ('file-error', str(e))
+
+
+def validate_blog_json(file_path, is_english=False, raw=None):
+    """Main validation function - returns a ValidationResult"""
+    results = ValidationResult(str(file_path))
     
     # 1. Check JSON syntax
-    is_valid, data, error = validate_json_syntax(file_path)
+    is_valid, data, error = validate_json_syntax(file_path, raw)
     if not is_valid:
-        results['valid'] = False
-        results['errors'].append(error)
+        results.add_error(*error)
         return results
     
-    # 2. Check required fields
-    required = EN_REQUIRED_FIELDS if is_english else VI_REQUIRED_FIELDS
-    errors = validate_required_fields(data, required)
-    results['errors'].extend(errors)
-    
-    # 3. Validate content structure
-    errors = validate_content_structure(data)
-    results['errors'].extend(errors)
-    
-    # 4. Validate FAQ structure
-    errors = validate_faq_structure(data)
-    results['errors'].extend(errors)
-    
-    # 5. Validate CTA structure
-    errors = validate_cta_structure(data)
-    results['errors'].extend(errors)
-    
-    # 6. Validate SEO structure
-    errors = validate_seo_structure(data)
-    results['errors'].extend(errors)
-    
-    # 7. Check schema for English
-    if is_english:
-        if 'schema' not in data:
-            results['errors'].append("Missing 'schema' object")
-        else:
-            for field in SCHEMA_REQUIRED:
-                if field not in data['schema']:
-                    results['errors'].append(f"Missing schema.{field}")
-    
-    # 8. Quality warnings
-    if 'keywords' in data:
-        if len(data['keywords']) < 5:
-            results['warnings'].append(f"Only {len(data['keywords'])} keywords (recommend 8-12)")
-    
-    if 'faq' in data and isinstance(data['faq'], list):
-        if len(data['faq']) < 5:
-            results['warnings'].append(f"Only {len(data['faq'])} FAQs (recommend 8-10)")
+    return validate_blog_data(data, is_english, results)
+
+
+def validate_blog_data(data, is_english=False, results=None):
+    """Validate an already parsed post (steps 2-8 of validate_blog_json)
+
+    All RULES are checked in a single walk over the document.
+    """
+    if results is None:
+        results = ValidationResult()
     
-    if 'content' in data and 'sections' in data['content']:
-        sections = data['content']['sections']
-        if len(sections) < 30:
-            results['warnings'].append(f"Only {len(sections)} sections (recommend 50+)")
+    with stage('validate'):
+        errors, warnings = run_rules(compiled_rules('en' if is_english else 'vi'), data)
+    results.errors.extend(errors)
+    results.warnings.extend(warnings)
     
     # Set final validity
-    results['valid'] = len(results['errors']) == 0
+    results.valid = not results.errors
     
     return results
 
 
-def validate_all_blogs():
-    """Validate all blog files in the project"""
+def rules_fingerprint():
+    """Hash of the rule tables and this module - changes invalidate the cache"""
+    rules = [
+        CACHE_VERSION, VI_REQUIRED_FIELDS, EN_REQUIRED_FIELDS,
+        CONTENT_REQUIRED, CTA_REQUIRED, SEO_REQUIRED, SCHEMA_REQUIRED
+    ]
+    h = hashlib.sha256(json.dumps(rules).encode('utf-8'))
+    h.update(repr(RULES).encode('utf-8'))
+    for module in (__file__, blog_rules.__file__):
+        h.update(Path(module).read_bytes())
+    return h.hexdigest()
+
+
+class ValidationCache:
+    """On-disk cache of validate_blog_json results
+
+    Entries are keyed by path and checked against mtime + size first; when
+    the stat changed, the content hash decides whether the result is reused.
+    """
+
+    def __init__(self, path=CACHE_PATH, fingerprint=None):
+        self.path = Path(path)
+        self.fingerprint = fingerprint or rules_fingerprint()
+        self.entries = {}
+        self.seen = set()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=CACHE_PATH):
+        cache = cls(path)
+        try:
+            with open(cache.path, 'rb') as f:
+                stored = loads(f.read())
+        except (OSError, ValueError):
+            return cache
+        if stored.get('fingerprint') == cache.fingerprint:
+            cache.entries = stored.get('files', {})
+        else:
+            cache.dirty = True
+        return cache
+
+    def is_fresh(self, file_path, is_english):
+        """True if the cached result can be reused on stat alone (mtime + size)"""
+        key = str(Path(file_path).resolve())
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if not entry or entry['english'] != is_english:
+            return False
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size
+
+    def cached(self, file_path):
+        """Stored result of a file is_fresh() accepted"""
+        entry = self.entries[str(Path(file_path).resolve())]
+        return ValidationResult.from_cache(entry['result'], str(file_path))
+
+    def lookup(self, file_path, is_english, raw):
+        """Stored result for file bytes whose stat changed but whose content
+        did not - None on a miss"""
+        entry = self.entries.get(str(Path(file_path).resolve()))
+        if not entry or entry['english'] != is_english:
+            return None
+        if entry['sha256'] != hashlib.sha256(raw).hexdigest():
+            return None
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        # Touched but not changed - refresh the stat key only
+        entry['mtime_ns'] = st.st_mtime_ns
+        entry['size'] = st.st_size
+        self.dirty = True
+        return ValidationResult.from_cache(entry['result'], str(file_path))
+
+    def store(self, file_path, is_english, raw, result):
+        if raw is None:
+            return
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        self.entries[str(Path(file_path).resolve())] = {
+            'english': is_english,
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'sha256': hashlib.sha256(raw).hexdigest(),
+            'result': result.to_cache()
+        }
+        self.dirty = True
+
+    def save(self, prune=False):
+        """Write the cache (prune: drop files not looked up in this run)"""
+        if prune:
+            for key in list(self.entries):
+                if key not in self.seen:
+                    del self.entries[key]
+                    self.dirty = True
+        if not self.dirty:
+            return
+        
+        payload = json.dumps({'fingerprint': self.fingerprint, 'files': self.entries},
+                             ensure_ascii=False)
+        atomic_write_bytes(self.path, payload.encode('utf-8'))
+        self.dirty = False
+
+
+def _validate_task(task):
+    """Process pool entry point - task is (file_path, is_english, raw)"""
+    file_path, is_english, raw = task
+    return validate_blog_json(file_path, is_english=is_english, raw=raw)
+
+
+def run_validation(tasks, jobs=1, cache=None):
+    """Validate (file_path, is_english) tasks, yielding results in task order
+
+    jobs > 1 spreads parsing/validation over a process pool; VI and EN
+    tasks share the same pool so both trees are validated concurrently.
+    With a cache, files with an unchanged stat are answered without being
+    opened; the rest are read ahead by blog_io.read_files. Results stream
+    out as soon as they are ready in order; at most jobs * 8 files are in
+    flight, so memory does not grow with the corpus.
+    """
+    tasks = list(tasks)
+    fresh = [bool(cache) and cache.is_fresh(file_path, is_english)
+             for file_path, is_english in tasks]
+    reads = read_files(file_path for (file_path, _), hit in zip(tasks, fresh) if not hit)
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    max_in_flight = jobs * 8
+    window = deque()  # [future or None, result, file_path, is_english, raw]
+    
+    def finish(entry):
+        future, result, file_path, is_english, raw = entry
+        if future is not None:
+            result = future.result()
+            if cache:
+                cache.store(file_path, is_english, raw, result)
+        return result
+    
+    try:
+        for (file_path, is_english), hit in zip(tasks, fresh):
+            if hit:
+                window.append((None, cache.cached(file_path), file_path, is_english, None))
+            else:
+                # raw None (unreadable): the validator re-opens it and reports the error
+                _, raw = next(reads)
+                result = None
+                if cache and raw is not None:
+                    result = cache.lookup(file_path, is_english, raw)
+                task = (file_path, is_english, raw)
+                if result is not None:
+                    window.append((None, result, file_path, is_english, raw))
+                elif pool:
+                    window.append((pool.submit(_validate_task, task), None,
+                                   file_path, is_english, raw))
+                else:
+                    result = _validate_task(task)
+                    if cache:
+                        cache.store(file_path, is_english, raw, result)
+                    window.append((None, result, file_path, is_english, raw))
+            
+            # Hand back everything that is already done, oldest first
+            while window and (window[0][0] is None or len(window) > max_in_flight):
+                yield finish(window.popleft())
+        
+        while window:
+            yield finish(window.popleft())
+    finally:
+        reads.close()
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def _emit_ndjson(record):
+    """Write one NDJSON line and flush so consumers see it immediately"""
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+
+def _file_record(lang, file_path, result):
+    return {
+        'type': 'file',
+        'lang': lang,
+        'slug': Path(file_path).stem,
+        'file': result.file,
+        'valid': result.valid,
+        'errors': result.error_messages(),
+        'warnings': result.warning_messages(),
+        'diagnostics': {'errors': [d.to_list() for d in result.errors],
+                        'warnings': [d.to_list() for d in result.warnings]}
+    }
+
+
+def _summary_record(counts, changed_since=None):
+    """Final NDJSON line - the same shape for full, --changed-since and single-file runs"""
+    return {
+        'type': 'summary',
+        'vi': {'valid': counts['vi']['valid'], 'invalid': counts['vi']['invalid']},
+        'en': {'valid': counts['en']['valid'], 'invalid': counts['en']['invalid']},
+        'changed_since': changed_since
+    }
+
+
+def validate_all_blogs(jobs=1, use_cache=True, changed_since=None, posts_dir=None,
+                       output_format='text'):
+    """Validate all blog files in the project
+
+    changed_since: git revision - only validate posts changed since then,
+    plus their linked VI/EN translations
+    posts_dir: VI posts directory (default content/blog/posts)
+    output_format: 'text', or 'ndjson' to stream one JSON line per file
+    plus a final summary line (invalid results are then not kept in memory)
+    """
+    ndjson = output_format == 'ndjson'
+
     BASE = Path(__file__).parent.parent
-    VI_POSTS = BASE / 'content' / 'blog' / 'posts'
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
     EN_POSTS = VI_POSTS / 'en'
     
     all_results = {
@@ -220,18 +427,40 @@ def validate_all_blogs():
         'en': {'valid': 0, 'invalid': 0, 'files': []}
     }
     
+    if changed_since:
+        vi_files, en_files = changed_since_closure(changed_since, VI_POSTS)
+    else:
+        vi_files = [p for p in sorted(VI_POSTS.glob('*.json'))
+                    if p.stem not in ['categories', 'categories.en']]
+        en_files = sorted(EN_POSTS.glob('*.json'))
+    
+    tasks = [(p, False) for p in vi_files] + [(p, True) for p in en_files]
+    cache = ValidationCache.load() if use_cache else None
+    results = run_validation(tasks, jobs=jobs, cache=cache)
+    
+    if ndjson:
+        for lang, files in (('vi', vi_files), ('en', en_files)):
+            for file_path in files:
+                result = next(results)
+                all_results[lang]['valid' if result.valid else 'invalid'] += 1
+                _emit_ndjson(_file_record(lang, file_path, result))
+        
+        _emit_ndjson(_summary_record(all_results, changed_since))
+        if cache:
+            cache.save(prune=not changed_since)
+        return all_results
+    
     print("🔍 VALIDATING BLOG JSON FILES")
     print("=" * 60)
+    if changed_since:
+        print(f"Changed since {changed_since}: {len(vi_files)} VI, {len(en_files)} EN (with translations)")
     
     # Validate Vietnamese posts
     print("\n📚 Vietnamese Posts:")
-    for file_path in sorted(VI_POSTS.glob('*.json')):
-        if file_path.stem in ['categories', 'categories.en']:
-            continue
-        
-        result = validate_blog_json(file_path, is_english=False)
+    for file_path in vi_files:
+        result = next(results)
         
-        if result['valid']:
+        if result.valid:
             all_results['vi']['valid'] += 1
             status = "✅"
         else:
@@ -239,19 +468,19 @@ def validate_all_blogs():
             status = "❌"
             all_results['vi']['files'].append(result)
         
-        if not result['valid'] or result['warnings']:
+        if not result.valid or result.warnings:
             print(f"  {status} {file_path.stem}")
-            for err in result['errors'][:3]:
+            for err in result.errors[:3]:
                 print(f"      ❌ {err}")
-            for warn in result['warnings'][:2]:
+            for warn in result.warnings[:2]:
                 print(f"      ⚠️  {warn}")
     
     # Validate English posts
     print("\n📚 English Posts:")
-    for file_path in sorted(EN_POSTS.glob('*.json')):
-        result = validate_blog_json(file_path, is_english=True)
+    for file_path in en_files:
+        result = next(results)
         
-        if result['valid']:
+        if result.valid:
             all_results['en']['valid'] += 1
             status = "✅"
         else:
@@ -260,9 +489,9 @@ def validate_all_blogs():
             all_results['en']['files'].append(result)
         
         print(f"  {status} {file_path.stem}")
-        for err in result['errors'][:3]:
+        for err in result.errors[:3]:
             print(f"      ❌ {err}")
-        for warn in result['warnings'][:2]:
+        for warn in result.warnings[:2]:
             print(f"      ⚠️  {warn}")
     
     # Summary
@@ -271,40 +500,181 @@ def validate_all_blogs():
     print(f"   Vietnamese: {all_results['vi']['valid']} valid, {all_results['vi']['invalid']} invalid")
     print(f"   English:    {all_results['en']['valid']} valid, {all_results['en']['invalid']} invalid")
     
+    if cache:
+        cache.save(prune=not changed_since)
+    
     return all_results
 
 
-def validate_single_file(file_path):
+def validate_single_file(file_path, use_cache=True, output_format='text'):
     """Validate a single file (for command line use)"""
     path = Path(file_path)
     is_english = 'en' in str(path.parent)
     
-    result = validate_blog_json(path, is_english=is_english)
+    cache = ValidationCache.load() if use_cache else None
+    result = next(run_validation([(path, is_english)], cache=cache))
+    if cache:
+        cache.save()
+    
+    if output_format == 'ndjson':
+        lang = 'en' if is_english else 'vi'
+        _emit_ndjson(_file_record(lang, path, result))
+        counts = {'vi': {'valid': 0, 'invalid': 0}, 'en': {'valid': 0, 'invalid': 0}}
+        counts[lang]['valid' if result.valid else 'invalid'] += 1
+        _emit_ndjson(_summary_record(counts))
+        return result.valid
     
     print(f"\n🔍 Validating: {path.name}")
     print("=" * 50)
     
-    if result['valid']:
+    if result.valid:
         print("✅ JSON is VALID!")
     else:
         print("❌ JSON is INVALID!")
         print("\nErrors:")
-        for err in result['errors']:
+        for err in result.errors:
             print(f"  • {err}")
     
-    if result['warnings']:
+    if result.warnings:
         print("\nWarnings:")
-        for warn in result['warnings']:
+        for warn in result.warnings:
             print(f"  ⚠️  {warn}")
     
-    return result['valid']
+    return result.valid
 
 
-if __name__ == '__main__':
-    if len(sys.argv) > 1:
+def _print_watch_result(lang, file_path, result):
+    status = "✅" if result.valid else "❌"
+    print(f"  {status} {lang}/{Path(file_path).stem}")
+    for err in result.errors:
+        print(f"      ❌ {err}")
+    for warn in result.warnings:
+        print(f"      ⚠️  {warn}")
+
+
+def watch_blogs(posts_dir=None, output_format='text', poll_interval=None):
+    """Keep the corpus in memory and revalidate posts as they change
+
+    Only the changed file and its linked VI/EN counterparts (before and
+    after the change, also when the file was deleted) are validated.
+    poll_interval: force the polling watcher (seconds) instead of inotify
+    """
+    from blog_watch import open_watcher
+    
+    BASE = Path(__file__).parent.parent
+    VI_POSTS = Path(posts_dir) if posts_dir else BASE / 'content' / 'blog' / 'posts'
+    EN_POSTS = VI_POSTS / 'en'
+    ndjson = output_format == 'ndjson'
+    
+    posts = {'vi': {}, 'en': {}}
+    for lang, directory in (('vi', VI_POSTS), ('en', EN_POSTS)):
+        for post in load_posts(directory, lang):
+            posts[lang][post.slug] = post
+    # Updated one slug at a time below, never rebuilt
+    index = CorpusIndex.from_posts(posts['vi'].values(), posts['en'].values())
+    
+    def counterparts(lang, slug):
+        if lang == 'vi':
+            return {('en', s) for s in index.counterparts_of_vi(slug)}
+        return {('vi', s) for s in index.counterparts_of_en(slug)}
+    
+    watcher = open_watcher([VI_POSTS, EN_POSTS], poll_interval=poll_interval)
+    if ndjson:
+        _emit_ndjson({'type': 'watch', 'backend': watcher.backend,
+                      'vi': len(posts['vi']), 'en': len(posts['en'])})
+    else:
+        print(f"👀 Watching {VI_POSTS} ({watcher.backend})")
+        print(f"   {len(posts['vi'])} VI + {len(posts['en'])} EN posts in memory - Ctrl+C to stop")
+    
+    try:
+        for changed in watcher.changes():
+            started = time.perf_counter()
+            targets = set()
+            
+            for path in sorted(changed):
+                lang = 'en' if path.parent == EN_POSTS else 'vi'
+                slug = path.stem
+                # Counterparts linked before the change too: a removed link
+                # or a deleted post affects them as well
+                targets |= counterparts(lang, slug)
+                if path.exists():
+                    post = posts[lang][slug] = load_post_file(path, lang)
+                    (index.add_en if lang == 'en' else index.add_vi)(slug, post.data)
+                    targets.add((lang, slug))
+                    targets |= counterparts(lang, slug)
+                elif posts[lang].pop(slug, None) is not None:
+                    (index.remove_en if lang == 'en' else index.remove_vi)(slug)
+                    if ndjson:
+                        _emit_ndjson({'type': 'removed', 'lang': lang, 'slug': slug})
+                    else:
+                        print(f"  🗑️  {lang}/{slug} removed")
+            targets = {(lang, slug) for lang, slug in targets if slug in posts[lang]}
+            
+            for lang, slug in sorted(targets, key=lambda t: (t[0] == 'en', t[1])):
+                post = posts[lang][slug]
+                result = ValidationResult(str(post.path))
+                if post.data is None:
+                    result.add_error('load-error', post.error)
+                else:
+                    validate_blog_data(post.data, post.is_english, result)
+                
+                if ndjson:
+                    _emit_ndjson(_file_record(lang, post.path, result))
+                else:
+                    _print_watch_result(lang, post.path, result)
+            
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if ndjson:
+                _emit_ndjson({'type': 'batch', 'files': len(targets), 'elapsed_ms': round(elapsed_ms, 1)})
+            elif targets:
+                print(f"  ⏱️  {len(targets)} file(s) in {elapsed_ms:.1f} ms\n")
+    except KeyboardInterrupt:
+        if not ndjson:
+            print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate blog JSON files',
+                                     epilog='--profile[-json PATH|-pstats PATH|-top N]: see blog_profile.py')
+    parser.add_argument('file', nargs='?', help='validate a single file')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='worker processes (0 = all CPU cores)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore and do not update the results cache')
+    parser.add_argument('--changed-since', metavar='REV',
+                        help='only validate posts changed since a git revision')
+    parser.add_argument('--format', choices=['text', 'ndjson'], default='text',
+                        help='ndjson: stream one JSON object per file, then a summary')
+    parser.add_argument('--watch', action='store_true',
+                        help='stay running and revalidate posts when they change')
+    parser.add_argument('--poll', type=float, metavar='SECONDS',
+                        help='with --watch: poll instead of using inotify')
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+    
+    if args.watch:
+        watch_blogs(output_format=args.format, poll_interval=args.poll)
+    elif args.file:
         # Validate single file
-        success = validate_single_file(sys.argv[1])
+        success = validate_single_file(args.file, use_cache=use_cache,
+                                       output_format=args.format)
         sys.exit(0 if success else 1)
     else:
         # Validate all files
-        validate_all_blogs()
+        jobs = args.jobs or os.cpu_count() or 1
+        try:
+            validate_all_blogs(jobs=jobs, use_cache=use_cache,
+                               changed_since=args.changed_since,
+                               output_format=args.format)
+        except RuntimeError as e:
+            if args.format == 'ndjson':
+                _emit_ndjson({'type': 'error', 'message': str(e)})
+            else:
+                print(f"❌ {e}")
+            sys.exit(2)
+
+
+if __name__ == '__main__':
+    run_profiled(main)